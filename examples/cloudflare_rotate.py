@@ -1,37 +1,65 @@
 import argparse
 import sys
-import os
 import random
+import threading
 import time
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from tls_chameleon.client import TLSChameleon
+try:
+    from tls_chameleon.client import TLSChameleon
+except ImportError:
+    sys.exit("tls_chameleon is not importable: run `pip install -e .` or set PYTHONPATH to the repo root")
+
+# Flatten line breaks and tabs in the body preview in a single pass
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# Private RNG for retry jitter, independent of the global random state
+_JITTER_RNG = random.Random()
 
 
 class DebugClient(TLSChameleon):
     def request(self, method: str, url: str, **kwargs):
-        original_on_block = self.on_block
+        # Bind hot attributes once; the loop below runs per attempt
+        parent_request = super().request
+        is_block = self._is_block
+        current_proxy = self._current_proxy
+        sleep = time.sleep
+        monotonic = time.monotonic
+        rand = _JITTER_RNG.random
+        jitter = self.retry_jitter
+        max_retries = self.max_retries
+        # Backoff schedule is fixed for the whole call; the monotonic deadline
+        # caps the total time spent waiting between attempts.
+        schedule = [self.retry_backoff_base * (1 << i) for i in range(max_retries)]
+        deadline = monotonic() + sum(schedule) + jitter * len(schedule)
+        rotation = None
         attempt = 0
         while True:
-            self.on_block = "none"
-            resp = super().request(method, url, **kwargs)
-            self.on_block = original_on_block
+            if rotation is not None:
+                rotation.join()
+                rotation = None
+            # Retries are driven from here, so the parent must not rotate on its own
+            resp = parent_request(method, url, on_block="none", **kwargs)
             code = getattr(resp, "status_code", None)
-            blocked = self._is_block(resp)
-            proxy = self._current_proxy()
-            print(f"attempt={attempt} engine={self.engine} profile={getattr(self, '_profile_name', '')} proxy={proxy} status={code} blocked={blocked}")
-            if not blocked or attempt >= self.max_retries:
+            blocked = is_block(resp)
+            print(f"attempt={attempt} engine={self.engine} profile={self.profile_name} proxy={current_proxy()} status={code} blocked={blocked}")
+            if not blocked or attempt >= max_retries:
                 return resp
             attempt += 1
-            if self.on_block in {"rotate", "both"}:
-                self._rotate_profile()
-                print(f"rotated profile -> {getattr(self, '_profile_name', '')}")
-            if self.on_block in {"proxy", "both"}:
-                self._rotate_proxy()
-                print(f"rotated proxy -> {self._current_proxy()}")
-            delay = self.retry_backoff_base * (2 ** (attempt - 1))
-            jitter = random.uniform(0, self.retry_jitter)
-            time.sleep(delay + jitter)
+            # Rotate while we back off instead of after it
+            rotation = threading.Thread(target=self._rotate)
+            rotation.start()
+            wait = min(schedule[attempt - 1] + rand() * jitter, deadline - monotonic())
+            if wait > 0:
+                sleep(wait)
+
+    def _rotate(self):
+        if self.on_block in {"rotate", "both"}:
+            self._rotate_profile()
+            self._switch_session()
+            print(f"rotated profile -> {self.profile_name}")
+        if self.on_block in {"proxy", "both"}:
+            self._rotate_proxy()
+            print(f"rotated proxy -> {self._current_proxy()}")
 
 
 def parse_args():
@@ -67,8 +95,9 @@ def main():
         print("error:", str(e))
         sys.exit(2)
     print("final status:", getattr(r, "status_code", None))
-    txt = getattr(r, "text", "") or ""
-    print("body:", txt[:500].replace("\n", " "))
+    # Decode only the bytes we show instead of the whole body
+    raw = (getattr(r, "content", b"") or b"")[:500]
+    print("body:", raw.decode("utf-8", "replace").translate(_NL_TABLE))
 
 
 if __name__ == "__main__":
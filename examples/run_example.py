@@ -1,9 +1,13 @@
 import argparse
 import sys
-import os
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from tls_chameleon import TLSChameleon
+try:
+    from tls_chameleon import TLSChameleon
+except ImportError:
+    sys.exit("tls_chameleon is not importable: run `pip install -e .` or set PYTHONPATH to the repo root")
+
+# Flatten line breaks and tabs in the body preview in a single pass
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
 
 
 def parse_args():
@@ -44,8 +48,9 @@ def main():
         print("error:", str(e))
         sys.exit(2)
     print("status:", getattr(r, "status_code", None))
-    txt = getattr(r, "text", "") or ""
-    print("body:", txt[:500].replace("\n", " "))
+    # Decode only the bytes we show instead of the whole body
+    raw = (getattr(r, "content", b"") or b"")[:500]
+    print("body:", raw.decode("utf-8", "replace").translate(_NL_TABLE))
     print("engine:", client.engine)
     print("profile:", getattr(client, "_profile_name", ""))
     print("user_agent:", client.headers.get("User-Agent"))
@@ -1,4 +1,13 @@
 from curl_cffi import requests
+
+print("Probing Session init...")
+try:
+    s = requests.Session(curl_options={})
+    print("Success: Session init accepts curl_options")
+except TypeError as e:
+    print(f"Failure Session init: {e}")
+
+print("Probing Session request...")
 try:
     s = requests.Session()
     print("Session created")
@@ -10,3 +19,10 @@ try:
         print(f"Failure: {e}")
 except Exception as e:
     print(f"General Failure: {e}")
+
+print("Probing top-level request...")
+try:
+    requests.get("https://example.com", curl_options={})
+    print("Success: top-level request accepts curl_options")
+except TypeError as e:
+    print(f"Failure top-level: {e}")
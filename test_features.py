@@ -22,8 +22,11 @@ def test_features():
         """
         # We need a response object to wrap. We can mock it or use a real request.
         # Let's use a real request to example.com and then check magnet on it.
+        # The same response also drives the Smart Static check below (mimic_assets=True),
+        # so the whole run costs a single GET over the shared session.
+        resp = None
         try:
-            resp = client.get("https://example.com")
+            resp = client.get("https://example.com", mimic_assets=True)
             print(f"URL: {resp.url}, Status: {resp.status_code}")
             print(f"Magnet Links found: {len(resp.magnet.links())}")
             print(f"Magnet Emails found: {len(resp.magnet.emails())}") # likely 0
@@ -37,13 +40,12 @@ def test_features():
 
         # 2. Smart Static
         print("\n[2] Testing Smart Static (Mimic Assets)...")
-        try:
-            # example.com is simple, let's try it
-            resp = client.get("https://example.com", mimic_assets=True)
+        if resp is not None:
+            # example.com is simple; the request above already ran with mimic_assets=True
             print("Request with mimic_assets=True completed.")
             # We can't easily verify background threads fired without logs, but it didn't crash.
-        except Exception as e:
-            print(f"Smart Static failed: {e}")
+        else:
+            print("Smart Static failed: no response")
 
         # 3. Humanize
         print("\n[3] Testing Humanize...")
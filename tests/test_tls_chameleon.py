@@ -1,3 +1,7 @@
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
 from unittest.mock import patch, MagicMock
 from tls_chameleon import TLSChameleon, Magnet, ChameleonResponse
@@ -51,3 +55,478 @@ def test_tls_chameleon_is_block_false_positive():
         
     assert client._is_block(Fake200Response()) == False
     assert client._is_block(Fake403Response()) == True
+
+def test_magnet_tables():
+    html = '''
+    <table class="prices">
+        <tr><th>Item</th><th>Price</th></tr>
+        <tr><td><b>Apple</b></td><td> 1.00 </td></tr>
+        <tr></tr>
+    </table>
+    <table><tr><td>second</td></tr></table>
+    <table><tr><td>never closed</td></tr>
+    '''
+    magnet = Magnet(html)
+    tables = magnet.tables()
+
+    assert tables == [
+        [["Item", "Price"], ["Apple", "1.00"]],
+        [["second"]],
+    ]
+    assert list(magnet.iter_tables()) == tables
+
+def test_magnet_elements_and_strip_tags():
+    from tls_chameleon.magnet import _elements, _strip_tags
+
+    text = '<tr class="a">x</tr><tr>y</tr><tr>open'
+    spans = list(_elements(text, "<tr", "</tr>"))
+    assert [text[s:gt] for s, gt, _ in spans] == [' class="a"', '']
+    assert [text[gt + 1:close] for _, gt, close in spans] == ['x', 'y']
+
+    assert _strip_tags('<b>bold</b> and <a href="#">link</a>') == 'bold and link'
+    # Like re.sub(r'<.*?>', '', ...), a tag spanning lines is left alone
+    assert _strip_tags('a <span\nclass="x">b</span>') == 'a <span\nclass="x">b'
+    assert _strip_tags('no tags') == 'no tags'
+
+class _ProxyEchoHandler(BaseHTTPRequestHandler):
+    # A proxied request carries the absolute URL in its request line
+    def do_GET(self):
+        body = b"proxied" if self.path.startswith("http://") else b"direct hit"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@contextmanager
+def _local_server(handler):
+    server = HTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+@pytest.mark.parametrize("engine", ["httpx", "curl"])
+def test_proxies_pool_only_is_used(engine):
+    with _local_server(_ProxyEchoHandler) as url:
+        with TLSChameleon(engine=engine, proxies_pool=[url], max_retries=0) as client:
+            if client.engine != engine:
+                pytest.skip(f"{engine} is not installed")
+            assert client.get(url + "/").text == "proxied"
+
+@pytest.mark.parametrize("engine", ["httpx", "curl"])
+def test_async_proxies_pool_only_is_used(engine):
+    import asyncio
+    from tls_chameleon import AsyncTLSChameleon
+
+    async def run(url):
+        async with AsyncTLSChameleon(engine=engine, proxies_pool=[url], max_retries=1) as client:
+            if client.engine != engine:
+                pytest.skip(f"{engine} is not installed")
+            return (await client.get(url + "/")).text
+
+    with _local_server(_ProxyEchoHandler) as url:
+        assert asyncio.run(run(url)) == "proxied"
+
+def test_mimic_assets_snapshots_cookies():
+    with TLSChameleon() as client:
+        client.session.cookies.set("sid", "abc", domain="example.com")
+        snapshot = client._cookie_snapshot()
+        client.session.cookies.clear()
+
+        assert [(c.name, c.value, c.domain) for c in snapshot] == [("sid", "abc", "example.com")]
+
+def test_http2_profile_is_cached_and_read_only():
+    from tls_chameleon.http2_simulator import get_http2_profile
+
+    profile = get_http2_profile("firefox_120")
+    assert profile is get_http2_profile("firefox_120")
+    assert profile["settings"] is get_http2_profile("firefox")["settings"]
+    with pytest.raises(TypeError):
+        profile["settings"] = {}
+
+    get_http2_profile.cache_clear()
+    assert get_http2_profile("firefox_120") is not profile
+
+def test_generate_variants():
+    from tls_chameleon.fingerprint_gallery import get_profile
+    from tls_chameleon.randomizer import FingerprintRandomizer
+
+    base = get_profile("chrome_120_win11")
+    base_ua = base["user_agent"]
+    variants = FingerprintRandomizer(base).generate_variants(5)
+
+    assert len(variants) == 5
+    assert len({id(v) for v in variants}) == 5
+    for variant in variants:
+        assert variant is not base
+        assert "Chrome/120." in variant["user_agent"]
+    assert base["user_agent"] == base_ua
+
+def test_session_pool_evicts_least_recently_used():
+    from tls_chameleon import client as client_module
+
+    def use_proxy(client, port):
+        proxy = f"http://127.0.0.1:{port}"
+        client.proxies = {"http": proxy, "https": proxy}
+        client._switch_session()
+        return client.session
+
+    with patch.object(client_module, "_MAX_POOLED_SESSIONS", 2):
+        with TLSChameleon(engine="httpx", fingerprint="firefox_120") as client:
+            direct = client.session
+            first = use_proxy(client, 1)
+            second = use_proxy(client, 2)
+            assert direct.is_closed
+            assert not first.is_closed
+
+            # A reused session becomes the most recently used
+            assert use_proxy(client, 1) is first
+            use_proxy(client, 3)
+            assert second.is_closed
+            assert not first.is_closed
+            assert len(client._sessions) == 2
+
+def test_is_block_peeks_at_body_head():
+    from tls_chameleon.client import _BLOCK_PEEK_BYTES
+
+    client = TLSChameleon()
+
+    class FakeErrorResponse:
+        status_code = 503
+
+        def __init__(self, content):
+            self.content = content
+
+    early = b"<title>Access Denied</title>" + b"x" * _BLOCK_PEEK_BYTES
+    late = b"x" * _BLOCK_PEEK_BYTES + b"<title>Access Denied</title>"
+    assert client._is_block(FakeErrorResponse(early)) == True
+    assert client._is_block(FakeErrorResponse(late)) == False
+
+def test_cached_clients():
+    from tls_chameleon import get, close_cached_sessions
+    from tls_chameleon import client as client_module
+
+    close_cached_sessions()
+    seen = []
+
+    def fake_get(self, url, **kwargs):
+        seen.append(self)
+        if url.endswith("/rotate"):
+            self.profile_name = "chrome_120_win11"
+        return url
+
+    with patch("tls_chameleon.client.TLSChameleon.get", fake_get):
+        get("https://example.com/1", fingerprint="firefox_120")
+        get("https://example.com/2", fingerprint="firefox_120")
+        assert seen[0] is seen[1]
+
+        # Other threads get their own client
+        thread = threading.Thread(target=get, args=("https://example.com/3",), kwargs={"fingerprint": "firefox_120"})
+        thread.start()
+        thread.join()
+        assert seen[2] is not seen[0]
+
+        # A call that rotated isn't reused with the rotated profile
+        get("https://example.com/rotate", fingerprint="firefox_120")
+        get("https://example.com/4", fingerprint="firefox_120")
+        assert seen[3] is seen[0]
+        assert seen[4] is not seen[0]
+        assert seen[4].profile_name == "firefox_120"
+
+    assert len(client_module._SESSION_CACHE) >= 1
+    with patch("tls_chameleon.client.TLSChameleon.close") as mock_close:
+        close_cached_sessions()
+        assert mock_close.called
+    assert len(client_module._SESSION_CACHE) == 0
+
+def test_cached_clients_evict_only_own_thread():
+    from tls_chameleon import get, close_cached_sessions
+    from tls_chameleon import client as client_module
+
+    close_cached_sessions()
+    closed = []
+    other_ready = threading.Event()
+    release = threading.Event()
+
+    def fake_get(self, url, **kwargs):
+        if url.endswith("/slow"):
+            other_ready.set()
+            release.wait(5)
+        return url
+
+    def fake_close(self):
+        closed.append(self)
+
+    with patch("tls_chameleon.client.TLSChameleon.get", fake_get), \
+         patch("tls_chameleon.client.TLSChameleon.close", fake_close), \
+         patch.object(client_module, "_SESSION_CACHE_MAXSIZE", 1):
+        thread = threading.Thread(target=get, args=("https://example.com/slow",))
+        thread.start()
+        other_ready.wait(5)
+        (other,) = client_module._SESSION_CACHE.values()
+
+        get("https://example.com/a", timeout=1)
+        get("https://example.com/b", timeout=2)
+        assert other not in closed
+        assert len(closed) == 1
+
+        release.set()
+        thread.join()
+        close_cached_sessions()
+
+@pytest.mark.parametrize("format", ["netscape", "json"])
+def test_cookies_round_trip(tmp_path, format):
+    from tls_chameleon.client import _make_cookie
+
+    path = str(tmp_path / "cookies.txt")
+    with TLSChameleon() as client:
+        jar = client.session.cookies.jar
+        jar.set_cookie(_make_cookie("sid", "abc", domain=".example.com", secure=True, expires=4102444800))
+        jar.set_cookie(_make_cookie("theme", "dark", domain="example.com", path="/app"))
+        client.save_cookies(path, format=format)
+
+    with TLSChameleon() as client:
+        client.load_cookies(path, format=format)
+        loaded = sorted(
+            (c.name, c.value, c.domain, c.path, c.secure, c.expires)
+            for c in client.session.cookies.jar
+        )
+
+    assert loaded == [
+        ("sid", "abc", ".example.com", "/", True, 4102444800),
+        ("theme", "dark", "example.com", "/app", False, None),
+    ]
+
+def test_session_headers_keep_wire_order_and_backend_defaults():
+    with TLSChameleon(engine="httpx", fingerprint="chrome_120_win11") as client:
+        template = [k.lower() for k in client._ordered_headers()]
+        names = [k.lower() for k in client.session.headers.keys()]
+        assert names[:len(template)] == template
+
+        # httpx's own defaults still go out unless the profile sets them
+        sent = client.session.build_request("HEAD", "https://example.com/").headers
+        assert sent["accept"] == "*/*"
+        assert sent["accept-encoding"] == "gzip, deflate"
+        assert sent["connection"] == "keep-alive"
+        assert sent["user-agent"] == client.headers["User-Agent"]
+
+def test_request_headers_overlay_the_template():
+    with TLSChameleon(engine="httpx", fingerprint="chrome_120_win11") as client:
+        template = client._ordered_headers()
+        assert client._request_headers({}) is template
+
+        # Overrides keep their slot and take the profile's casing; unknown
+        # headers go last
+        merged = client._request_headers({"User-Agent": "custom", "X-Test": "1"})
+        assert list(merged) == list(template) + ["x-test"]
+        assert merged["user-agent"] == "custom"
+
+        # A new header the order rule places gets the full layout
+        placed = client._request_headers({"Upgrade-Insecure-Requests": "1"})
+        assert list(placed) == [
+            "sec-ch-ua", "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent",
+        ]
+
+def test_json_fuzzy_strips_jsonp_padding():
+    class FakeResponse:
+        def __init__(self, text):
+            self.text = text
+
+    def fuzzy(text):
+        return ChameleonResponse(FakeResponse(text)).json_fuzzy()
+
+    assert fuzzy('jQuery123_456({"a": 1});') == {"a": 1}
+    assert fuzzy(' callback([1, 2]) ') == [1, 2]
+    assert fuzzy('{"plain": "(json)"}') == {"plain": "(json)"}
+    assert fuzzy('cb({"a": [1, 2,],})') == {"a": [1, 2]}
+    with pytest.raises(ValueError):
+        fuzzy('not a callback({"a": 1})')
+
+def test_is_block_peek_tolerates_non_utf8_bytes():
+    client = TLSChameleon()
+
+    class FakeErrorResponse:
+        status_code = 500
+        # Cut mid-way through a UTF-8 sequence, then a marker
+        content = "é".encode("utf-8")[:1] + b"\xff Error 1020 "
+
+    class FakeTextResponse:
+        status_code = 500
+        text = "Bot detected"
+
+    assert client._is_block(FakeErrorResponse()) == True
+    assert client._is_block(FakeTextResponse()) == True
+
+def test_async_request_functions():
+    import asyncio
+    from unittest.mock import AsyncMock
+    from tls_chameleon import arequest, aget, apost, aput, adelete, ahead, apatch, aoptions
+
+    async def run():
+        with patch("tls_chameleon.async_client.AsyncTLSChameleon.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = "resp"
+            assert await arequest("GET", "https://example.com", timeout=5, params={"q": "1"}) == "resp"
+            for func, method in (
+                (aget, "GET"), (apost, "POST"), (aput, "PUT"), (adelete, "DELETE"),
+                (ahead, "HEAD"), (apatch, "PATCH"), (aoptions, "OPTIONS"),
+            ):
+                await func("https://example.com", data="x")
+                mock_request.assert_called_with(method, "https://example.com", data="x")
+            mock_request.assert_any_call("GET", "https://example.com", params={"q": "1"})
+
+    asyncio.run(run())
+
+def test_async_client_close_and_methods():
+    import asyncio
+    from unittest.mock import AsyncMock
+    from tls_chameleon import AsyncTLSChameleon
+
+    async def run():
+        client = AsyncTLSChameleon()
+        session = MagicMock()
+        session.aclose = AsyncMock()
+        client.session = session
+        with patch.object(AsyncTLSChameleon, "request", new_callable=AsyncMock) as mock_request:
+            await client.put("https://example.com", json={"a": 1})
+            mock_request.assert_called_once_with("PUT", "https://example.com", json={"a": 1})
+        await client.close()
+        session.aclose.assert_awaited_once()
+        assert client.session is None
+        await client.close()  # Closing twice is a no-op
+
+    asyncio.run(run())
+
+class _FakeSourceResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._data = data
+
+    def json(self):
+        return self._data
+
+def test_updater_revalidates_expired_cache(tmp_path):
+    import os
+    import time
+    from tls_chameleon.fingerprint_updater import (
+        CACHE_TTL_SECONDS, FINGERPRINT_SOURCES, FingerprintUpdater,
+    )
+
+    client = MagicMock()
+    client.get.return_value = _FakeSourceResponse(200, [{"ja3_hash": "abc"}], {"ETag": '"v1"'})
+    updater = FingerprintUpdater(cache_dir=tmp_path, prewarm=False)
+    updater._http_client = client
+
+    first = updater.fetch_fingerprints("ja3er")
+    assert first["data"] == [{"ja3_hash": "abc"}]
+    assert first["etag"] == '"v1"'
+    client.get.assert_called_once_with(FINGERPRINT_SOURCES["ja3er"], headers={})
+
+    # Fresh copies are served from memory without a request
+    assert updater.fetch_fingerprints("ja3er") is first
+    assert client.get.call_count == 1
+
+    # An expired copy is revalidated, and a 304 keeps it
+    stale = time.time() - CACHE_TTL_SECONDS - 60
+    os.utime(tmp_path / "ja3er.json", (stale, stale))
+    updater._loaded.clear()
+    client.get.return_value = _FakeSourceResponse(304)
+    again = updater.fetch_fingerprints("ja3er")
+    assert again == first
+    assert client.get.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+    assert time.time() - (tmp_path / "ja3er.json").stat().st_mtime < 60
+
+def test_updater_prewarm_loads_every_source_once(tmp_path):
+    from tls_chameleon.fingerprint_updater import FINGERPRINT_SOURCES, FingerprintUpdater
+
+    fetched = []
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def fake_get(url, headers=None):
+        release.wait(5)
+        with lock:
+            fetched.append(url)
+        return _FakeSourceResponse(200, [])
+
+    client = MagicMock()
+    client.get.side_effect = fake_get
+    with patch.object(FingerprintUpdater, "_get_http_client", return_value=client):
+        updater = FingerprintUpdater(cache_dir=tmp_path, prewarm=True)
+        assert set(updater._prewarm_futures) == set(FINGERPRINT_SOURCES)
+
+        # A fetch during the prewarm waits for it instead of downloading again
+        release.set()
+        for source in FINGERPRINT_SOURCES:
+            assert updater.fetch_fingerprints(source)["data"] == []
+        assert sorted(fetched) == sorted(FINGERPRINT_SOURCES.values())
+        assert updater._prewarm_futures == {}
+
+def test_magnet_iter_forms_is_lazy():
+    html = (
+        '<form action="/a"><input name="x" value="1"></form>'
+        '<form action="/b"></form>'
+    )
+    forms = Magnet(html).iter_forms()
+
+    assert next(forms) == {"action": "/a", "method": "GET", "inputs": {"x": "1"}}
+    assert next(forms)["action"] == "/b"
+    assert list(Magnet(html).iter_forms()) == Magnet(html).get_forms()
+    assert list(Magnet("no forms here").iter_forms()) == []
+
+def test_magnet_form_attributes():
+    html = '''
+    <FORM ACTION='/search' method="get">
+        <input data-name="decoy" name="q" value="chameleon">
+        <INPUT Name='page' Value='2'>
+        <input type="submit">
+        <input
+            name="multiline" value="skipped">
+    </FORM>
+    '''
+    forms = Magnet(html).get_forms()
+
+    assert len(forms) == 1
+    assert forms[0]["action"] == "/search"
+    assert forms[0]["method"] == "get"
+    assert forms[0]["inputs"] == {"q": "chameleon", "page": "2"}
+
+def test_magnet_emails():
+    import re
+
+    text = (
+        "Contact sales@example.com or support@example.co.uk. "
+        "Again: sales@example.com, bad@ and @nobody, a@b.c, "
+        + "x" * 5000 + " first.last+tag@sub.example.org"
+    )
+    emails = Magnet(text).emails()
+
+    assert emails == [
+        "sales@example.com",
+        "support@example.co.uk",
+        "first.last+tag@sub.example.org",
+    ]
+    # Same matches as the single regex it replaces
+    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    assert emails == list(dict.fromkeys(re.findall(pattern, text)))
+
+def test_magnet_iter_tables_and_emails_are_lazy():
+    html = (
+        '<table><tr><td>1</td></tr></table><table><tr><td>2</td></tr></table>'
+        'a@example.com b@example.com a@example.com'
+    )
+    magnet = Magnet(html)
+
+    tables = magnet.iter_tables()
+    assert next(tables) == [["1"]]
+    assert next(tables) == [["2"]]
+    emails = magnet.iter_emails()
+    assert next(emails) == "a@example.com"
+    assert list(emails) == ["b@example.com"]
+    assert list(magnet.iter_emails()) == magnet.emails()
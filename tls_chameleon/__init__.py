@@ -13,10 +13,13 @@ v2.0 Features:
 - Auto-update system for fingerprints
 """
 
+import importlib
+
 from .client import (
     TLSChameleon, 
     Session,
     TLSSession,  # New v2.0: recommended alias
+    ChameleonResponse,
     request, 
     get, 
     post, 
@@ -25,10 +28,23 @@ from .client import (
     head, 
     patch, 
     options,
+    close_cached_sessions,
     list_available_profiles,  # New v2.0
 )
+from .magnet import Magnet
 
-from .async_client import AsyncTLSChameleon, AsyncSession
+from .async_client import (
+    AsyncTLSChameleon,
+    AsyncSession,
+    arequest,
+    aget,
+    apost,
+    aput,
+    adelete,
+    ahead,
+    apatch,
+    aoptions,
+)
 
 # New v2.0 modules
 try:
@@ -45,20 +61,34 @@ except ImportError:
     FINGERPRINT_GALLERY = {}
     get_profile = None
 
-try:
-    from .http2_simulator import HTTP2Profile, get_http2_profile
-except ImportError:
-    HTTP2Profile = None
+# Optional helpers are imported on first access (PEP 562) so that
+# `import tls_chameleon` only pays for what the client itself needs.
+_LAZY_ATTRS = {
+    "HTTP2Profile": ".http2_simulator",
+    "get_http2_profile": ".http2_simulator",
+    "FingerprintRandomizer": ".randomizer",
+    "create_variant_profile": ".randomizer",
+    "FingerprintUpdater": ".fingerprint_updater",
+    "update_fingerprints": ".fingerprint_updater",
+}
 
-try:
-    from .randomizer import FingerprintRandomizer, create_variant_profile
-except ImportError:
-    FingerprintRandomizer = None
 
-try:
-    from .fingerprint_updater import FingerprintUpdater, update_fingerprints
-except ImportError:
-    FingerprintUpdater = None
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        value = None
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __version__ = "2.1.1"
 
@@ -81,6 +111,21 @@ __all__ = [
     "head",
     "patch",
     "options",
+    "close_cached_sessions",
+
+    # Async request functions
+    "arequest",
+    "aget",
+    "apost",
+    "aput",
+    "adelete",
+    "ahead",
+    "apatch",
+    "aoptions",
+
+    # Responses and parsing
+    "ChameleonResponse",
+    "Magnet",
 
     # Profile utilities
     "list_available_profiles",
@@ -1,8 +1,8 @@
-from typing import Any, Dict, Optional, List, Callable, Union
-import ssl
+from typing import Any, Dict, Optional, List, Callable, Mapping, Union
 import time
 import random
 import logging
+import inspect
 from urllib.parse import urlparse
 
 from .client import (
@@ -10,26 +10,24 @@ from .client import (
     _DOMAIN_MEMORY_LOCK,
     _select_engine,
     _cipher_list,
+    _get_curl,
+    _get_httpx,
+    _httpx_http2,
+    _build_ssl_context,
+    _cached_ssl_context,
+    _get_profile as _shared_profile,
+    _as_proxy_dict,
+    _split_kwargs,
     ChameleonResponse
 )
 
-from .profiles import DEFAULT_PROFILE, get_profile as legacy_get_profile
+from .profiles import DEFAULT_PROFILE
 try:
-    from .fingerprint_gallery import FINGERPRINT_GALLERY, get_profile as gallery_get_profile, randomize_profile
+    from .fingerprint_gallery import FINGERPRINT_GALLERY, randomize_profile
     HAS_GALLERY = True
 except ImportError:
     HAS_GALLERY = False
 
-try:
-    from curl_cffi import requests as crequests
-except Exception:
-    crequests = None
-
-try:
-    import httpx
-except Exception:
-    httpx = None
-
 logger = logging.getLogger(__name__)
 
 class AsyncTLSChameleon:
@@ -88,6 +86,7 @@ class AsyncTLSChameleon:
         self.rate_limit = rate_limit
         self._rate_limit_last: Dict[str, float] = {}
         self.proxies_pool = proxies_pool
+        self._proxies_pool_normalized = [_as_proxy_dict(p) for p in proxies_pool or ()]
         self.header_order = header_order
         self.http2 = http2
         self.verify = verify
@@ -98,16 +97,17 @@ class AsyncTLSChameleon:
             self.proxies = {"http": proxies, "https": proxies}
         else:
             self.proxies = proxies or {}
+        # Like the sync client, a pool's first entry is the proxy in use
+        if self._proxies_pool_normalized:
+            self.proxies = self._proxies_pool_normalized[0]
             
         self.session = None
+        self._rng = random.Random()  # Per-instance RNG for jitter and rotation
 
-    def _get_profile(self) -> Dict[str, Any]:
-        p = gallery_get_profile(self.profile_name) if HAS_GALLERY else None
-        if not p:
-            p = legacy_get_profile(self.profile_name)
-        if not p:
-            p = legacy_get_profile(DEFAULT_PROFILE)
-        return p or {}
+    def _get_profile(self) -> Mapping[str, Any]:
+        # The sync client's frozen, already legacy-converted record (with
+        # tls12_ciphers), shared rather than converted per session
+        return _shared_profile(self.profile_name)
 
     def _init_session(self) -> None:
         if self.session:
@@ -123,7 +123,9 @@ class AsyncTLSChameleon:
             except Exception:
                 pass
 
-        if self.engine == "curl" and crequests is not None:
+        crequests = _get_curl()[0] if self.engine == "curl" else None
+        httpx = _get_httpx() if self.engine == "httpx" else None
+        if crequests is not None:
             impersonate = profile.get("impersonate", "chrome120")
             self.session = crequests.AsyncSession(
                 impersonate=impersonate,
@@ -133,26 +135,20 @@ class AsyncTLSChameleon:
             if self.proxies:
                 self.session.proxies = self.proxies
         elif self.engine == "httpx" and httpx is not None:
-            ssl_context = ssl.create_default_context()
-            if not self.verify:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            
-            cipher_str = _cipher_list(profile, self.randomize_ciphers)
-            if cipher_str:
-                try:
-                    ssl_context.set_ciphers(cipher_str)
-                except Exception:
-                    pass
+            cipher_str = _cipher_list(profile, self.randomize_ciphers, self._rng)
+            if self.randomize_ciphers:
+                ssl_context = _build_ssl_context(cipher_str, self.verify)
+            else:
+                ssl_context = _cached_ssl_context(cipher_str, self.verify)
                     
+            proxies = self.proxies
             self.session = httpx.AsyncClient(
-                http2=bool(self.http2) if self.http2 is not None else False,
+                http2=_httpx_http2(self.http2),
                 timeout=self.timeout,
                 verify=ssl_context,
+                proxy=(proxies.get("https") or proxies.get("http")) if proxies else None,
                 follow_redirects=True
             )
-            if self.proxies:
-                self.session.proxies = {k: v for k, v in self.proxies.items()}
         else:
             raise RuntimeError(f"Engine {self.engine} not available.")
 
@@ -161,11 +157,19 @@ class AsyncTLSChameleon:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            if hasattr(self.session, "aclose"):
-                await self.session.aclose()
-            elif hasattr(self.session, "close"):
-                self.session.close()
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying session, releasing its pooled connections."""
+        session, self.session = self.session, None
+        if session is None:
+            return
+        # httpx has aclose(); curl_cffi's AsyncSession.close() is the coroutine
+        close = getattr(session, "aclose", None) or getattr(session, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
 
     async def request(self, method: str, url: str, **kwargs: Any):
         if not self.session:
@@ -185,7 +189,7 @@ class AsyncTLSChameleon:
         attempt = 1
         while True:
             try:
-                if self.engine == "httpx" and httpx is not None:
+                if self.engine == "httpx":
                     resp = await self.session.request(method, url, **kwargs)
                 else:
                     resp = await getattr(self.session, method.lower())(url, **kwargs)
@@ -211,13 +215,15 @@ class AsyncTLSChameleon:
 
             attempt += 1
             if self.rotate_profiles:
-                idx = random.randint(0, len(self.rotate_profiles)-1)
+                idx = self._rng.randint(0, len(self.rotate_profiles)-1)
                 self.profile_name = self.rotate_profiles[idx]
+                # _init_session can't await, so release the old pool here
+                await self.close()
                 self._init_session()
                 
             import asyncio
-            delay = self.retry_backoff_base * (2 ** (attempt - 1))
-            await asyncio.sleep(delay + random.uniform(0, self.retry_jitter))
+            delay = self.retry_backoff_base * (1 << (attempt - 1))
+            await asyncio.sleep(delay + self._rng.uniform(0, self.retry_jitter))
 
     async def get(self, url: str, **kwargs: Any):
         return await self.request("GET", url, **kwargs)
@@ -225,4 +231,52 @@ class AsyncTLSChameleon:
     async def post(self, url: str, **kwargs: Any):
         return await self.request("POST", url, **kwargs)
 
+    async def put(self, url: str, **kwargs: Any):
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any):
+        return await self.request("DELETE", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any):
+        return await self.request("HEAD", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any):
+        return await self.request("PATCH", url, **kwargs)
+
+    async def options(self, url: str, **kwargs: Any):
+        return await self.request("OPTIONS", url, **kwargs)
+
 AsyncSession = AsyncTLSChameleon
+
+
+# One-shot async counterparts of the module-level request functions. Each
+# call opens and closes its own client; for many requests, keep one
+# AsyncTLSChameleon open and gather on it to share its connection pool.
+async def _acall(method: str, url: str, fingerprint: Optional[str], kwargs: Dict[str, Any], *args: Any):
+    session_kw, request_kw = _split_kwargs(kwargs)
+    async with AsyncTLSChameleon(fingerprint=fingerprint, **session_kw) as client:
+        return await getattr(client, method)(*args, url, **request_kw)
+
+async def arequest(method: str, url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("request", url, fingerprint, kwargs, method)
+
+async def aget(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("get", url, fingerprint, kwargs)
+
+async def apost(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("post", url, fingerprint, kwargs)
+
+async def aput(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("put", url, fingerprint, kwargs)
+
+async def adelete(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("delete", url, fingerprint, kwargs)
+
+async def ahead(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("head", url, fingerprint, kwargs)
+
+async def apatch(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("patch", url, fingerprint, kwargs)
+
+async def aoptions(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return await _acall("options", url, fingerprint, kwargs)
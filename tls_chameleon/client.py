@@ -1,15 +1,24 @@
+import atexit
 import random
 import re
 import json
-import ssl
 import time
-from typing import Any, Dict, Optional, List, Callable, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, Callable, Mapping, Union
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 import http.cookiejar
 import os
-import copy
+import functools
 import logging
+import operator
+from types import MappingProxyType
+
+# ssl and asyncio (which loads ssl too) are only needed by the httpx engine
+# and asset mimicking, so they are imported where used
+if TYPE_CHECKING:
+    import ssl
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,6 +29,90 @@ logger = logging.getLogger(__name__)
 _DOMAIN_MEMORY: Dict[str, str] = {}
 _DOMAIN_MEMORY_LOCK = threading.Lock()
 
+# Precompiled patterns for response parsing
+_JSONP_CALLBACK_RE = re.compile(r'\w+')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+# <link href>, <script src> and <img src> in a single scan
+_ASSET_RE = re.compile(
+    r'''<(?:link[^>]*?href|script[^>]*?src|img[^>]*?src)=["\']([^"\']+)["\']''',
+    re.I,
+)
+# Block detection: status codes and body keywords (see TLSChameleon._is_block)
+_BLOCK_CODES = frozenset({403, 429, 1020})
+_BLOCK_KEYWORDS = ("access denied", "error 1020", "attention required", "bot detected")
+_BLOCK_RE = re.compile("|".join(map(re.escape, _BLOCK_KEYWORDS)), re.I)
+# Leading body bytes scanned for those keywords
+_BLOCK_PEEK_BYTES = 8192
+# Cap on assets prefetched per page by _mimic_assets
+_MAX_MIMIC_ASSETS = 20
+# Asset URLs remembered as already prefetched (per client), like a browser cache
+_MAX_PREFETCHED_ASSETS = 4096
+# Sessions a client keeps open for reuse across rotations (LRU)
+_MAX_POOLED_SESSIONS = 8
+# Page prefetch batches allowed to run in the background at once
+_MIMIC_ASSET_WORKERS = 4
+# Prefetch HEADs in flight per origin (browsers open 6 connections per host)
+_MIMIC_ORIGIN_CONNECTIONS = 6
+# Maps random bytes onto the characters of ghost-mode payload padding values
+_PADDING_TABLE = bytes(b"abcdefghijklmnopqrstuvwxyz0123456789"[i % 36] for i in range(256))
+
+
+# Site presets (see TLSChameleon._apply_site_preset). Values are tuples so
+# the table is shared by all instances; lists are only made when applied.
+# Retries/jitter are lower bounds, the backoff base is an upper bound.
+_SITE_PRESETS: Dict[str, Dict[str, Any]] = {
+    "cloudflare": {
+        "rotate_profiles": ("chrome_124", "chrome_120", "mobile_safari_17"),
+        "max_retries": 3,
+        "retry_backoff_base": 0.8,
+        "retry_jitter": 0.4,
+        "http2": True,
+        "header_order": ("User-Agent", "Accept", "Accept-Language", "Accept-Encoding", "Connection"),
+    },
+}
+
+# Fields written by save_cookies(format="json"), fetched in one call
+_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "expires")
+_get_cookie_fields = operator.attrgetter(*_COOKIE_FIELDS)
+
+
+def _make_cookie(
+    name: str,
+    value: str,
+    domain: str = "",
+    path: str = "/",
+    secure: bool = False,
+    expires: Optional[int] = None,
+    http_only: bool = False,
+) -> http.cookiejar.Cookie:
+    """Build an http.cookiejar.Cookie from plain cookie fields."""
+    return http.cookiejar.Cookie(
+        version=0,
+        name=name,
+        value=value,
+        port=None,
+        port_specified=False,
+        domain=domain,
+        domain_specified=bool(domain),
+        domain_initial_dot=domain.startswith("."),
+        path=path,
+        path_specified=bool(path),
+        secure=secure,
+        expires=expires,
+        discard=False,
+        comment=None,
+        comment_url=None,
+        rest={"HttpOnly": http_only},
+        rfc2109=False,
+    )
+
+
+def _iter_assets(html: str):
+    """Yield link/script/img URLs from `html` lazily, in document order."""
+    for m in _ASSET_RE.finditer(html):
+        yield m.group(1)
+
+
 from .profiles import PROFILES, DEFAULT_PROFILE, get_profile as profiles_get_profile
 from .magnet import Magnet
 
@@ -36,71 +129,200 @@ except ImportError:
     FINGERPRINT_GALLERY = {}
     HAS_GALLERY = False
 
-try:
-    from .http2_simulator import HTTP2Profile, get_http2_profile
-    HAS_HTTP2_SIM = True
-except ImportError:
-    HAS_HTTP2_SIM = False
+# Every valid profile name, legacy or gallery (the registries are fixed at import)
+_PROFILE_NAMES = frozenset(PROFILES).union(FINGERPRINT_GALLERY)
+# Legacy Chrome profiles, the targets of the Cloudflare adaptation
+_CHROME_PROFILE_NAMES = tuple(n for n in PROFILES if "chrome" in n)
+
+# The HTTP backends are imported on first use: curl_cffi loads a large
+# native library, so scripts that only need one engine skip the other.
+_curl_modules = None
+_httpx_module = None
+
+
+def _get_curl():
+    """Return (curl_cffi.requests, curl_cffi.curl), or (None, None) if unavailable."""
+    global _curl_modules
+    if _curl_modules is None:
+        try:
+            from curl_cffi import requests as crequests
+            from curl_cffi import curl as ccurl
+            _curl_modules = (crequests, ccurl)
+        except Exception:
+            _curl_modules = (None, None)
+    return _curl_modules
+
+
+def _get_httpx():
+    """Return the httpx module, or None if unavailable."""
+    global _httpx_module
+    if _httpx_module is None:
+        try:
+            import httpx
+            _httpx_module = httpx
+        except Exception:
+            _httpx_module = False
+    return _httpx_module or None
 
-try:
-    from curl_cffi import requests as crequests
-    from curl_cffi import curl as ccurl
-except Exception:
-    crequests = None
-    ccurl = None
+
+@functools.lru_cache(maxsize=1)
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _httpx_http2(http2: Optional[bool]) -> bool:
+    """
+    The httpx `http2` flag for a client setting: explicit values win, and
+    None (the default) means HTTP/2 whenever the `h2` package is installed.
+    """
+    if http2 is None:
+        return _h2_available()
+    return bool(http2)
 
 try:
-    import httpx
+    import orjson
 except Exception:
-    httpx = None
+    orjson = None
+
 
+def _as_proxy_dict(proxy: Optional[Union[Dict[str, str], str]]) -> Dict[str, str]:
+    """Normalize a proxy URL or requests-style dict to a dict."""
+    if proxy and isinstance(proxy, str):
+        return {"http": proxy, "https": proxy}
+    return proxy or {}
 
+
+@functools.lru_cache(maxsize=None)
 def _select_engine(preferred: Optional[str]) -> str:
+    # Only the backend that ends up chosen (or ruled out) gets imported
     if preferred in ("curl", "httpx"):
-        if preferred == "curl" and crequests is None:
+        if preferred == "curl" and _get_curl()[0] is None:
             return "httpx"
-        if preferred == "httpx" and httpx is None:
-            return "curl" if crequests is not None else "httpx"
+        if preferred == "httpx" and _get_httpx() is None:
+            return "curl" if _get_curl()[0] is not None else "httpx"
         return preferred
-    if crequests is not None:
+    if _get_curl()[0] is not None:
         return "curl"
     return "httpx"
 
 
-def _get_profile(name: Optional[str], use_gallery: bool = True) -> Dict[str, Any]:
-    """Get a profile by name, checking gallery first if available."""
+@functools.lru_cache(maxsize=64)
+def _get_profile(name: Optional[str], use_gallery: bool = True) -> Mapping[str, Any]:
+    """
+    Get a profile by name, checking gallery first if available.
+    
+    Results are memoized (rotation and every request look profiles up) and
+    shared, so they are handed out as read-only views; copy with dict()
+    before changing anything.
+    """
     if not name:
         name = DEFAULT_PROFILE
     
     # Try new gallery first
-    if use_gallery and HAS_GALLERY:
-        profile = gallery_get_profile(name)
-        if profile:
-            # Convert to legacy format if needed
-            if "ciphers" in profile and "tls12_ciphers" not in profile:
-                profile = dict(profile)
-                profile["tls12_ciphers"] = profile["ciphers"]
-            return profile
-    
-    # Fall back to legacy profiles
-    return PROFILES.get(name, PROFILES.get(DEFAULT_PROFILE, {}))
-
-
-def _cipher_list(profile: Dict[str, Any], randomize: bool) -> Optional[str]:
-    ciphers = list(profile.get("tls12_ciphers") or [])
+    profile = gallery_get_profile(name) if use_gallery and HAS_GALLERY else None
+    if not profile:
+        # Fall back to legacy profiles
+        profile = PROFILES.get(name, PROFILES.get(DEFAULT_PROFILE, {}))
+
+    # Convert to legacy format, freezing the cipher suites so the
+    # snapshot can't be shuffled in place
+    profile = dict(profile)
+    ciphers = profile.get("tls12_ciphers", profile.get("ciphers"))
+    if ciphers is not None:
+        profile["tls12_ciphers"] = tuple(ciphers)
+    return MappingProxyType(profile)
+
+
+def _cipher_list(
+    profile: Mapping[str, Any],
+    randomize: bool,
+    rng: Optional[random.Random] = None,
+) -> Optional[str]:
+    ciphers = profile.get("tls12_ciphers")
     if not ciphers:
         return None
     if randomize:
-        random.shuffle(ciphers)
+        # Sorting on random keys is a uniform shuffle that builds the new
+        # list in one C-level pass, cheaper than copying and shuffling
+        draw = (rng or random).random
+        ciphers = sorted(ciphers, key=lambda _item: draw())
     return ":".join(ciphers)
 
 
+@functools.lru_cache(maxsize=256)
+def _case_header(name: str, case_mode: str) -> str:
+    """
+    Spell a header name in the profile's casing ("lower", "title" or as
+    given). Header vocabularies are small, so results are memoized.
+    """
+    if case_mode == "lower":
+        return name.lower()
+    if case_mode == "title":
+        return "-".join(word.capitalize() for word in name.split("-"))
+    return name
+
+
+@functools.lru_cache(maxsize=64)
+def _static_cipher_list(profile_name: str) -> Optional[str]:
+    """Unshuffled cipher string for a profile name (memoized)."""
+    return _cipher_list(_get_profile(profile_name), False)
+
+
+def _build_ssl_context(cipher_str: Optional[str], verify: bool) -> "ssl.SSLContext":
+    """Create an SSL context for the httpx engine with the given cipher list."""
+    import ssl
+
+    ssl_context = ssl.create_default_context()
+    if not verify:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    
+    if cipher_str:
+        try:
+            ssl_context.set_ciphers(cipher_str)
+        except Exception as e:
+            logger.debug(f"Failed to set ciphers for httpx: {e}")
+    return ssl_context
+
+
+# Loading the CA store is the expensive part of building a context, so
+# session re-inits (e.g. rotate-on-block) share one per cipher list.
+_cached_ssl_context = functools.lru_cache(maxsize=32)(_build_ssl_context)
+
+
 class ChameleonResponse:
     """Wrapper around Response to add Magnet features."""
+    __slots__ = ("_resp", "_magnet")
+
     def __init__(self, original_response: Any):
         self._resp = original_response
         self._magnet = None
 
+    # Hot fields are forwarded directly instead of going through __getattr__
+    @property
+    def status_code(self):
+        return self._resp.status_code
+
+    @property
+    def text(self):
+        return self._resp.text
+
+    @property
+    def content(self):
+        return self._resp.content
+
+    @property
+    def headers(self):
+        return self._resp.headers
+
+    @property
+    def url(self):
+        return self._resp.url
+
     @property
     def magnet(self):
         if self._magnet is None:
@@ -109,15 +331,18 @@ class ChameleonResponse:
         
     def json_fuzzy(self):
         """Attempts to parse JSON from broken/JSONP responses."""
-        # Simple implementation
-        t = getattr(self._resp, "text", "")
-        # Strip padding like callback(...)
-        t = re.sub(r'^\w+\((.*)\);?$', r'\1', t.strip())
+        t = getattr(self._resp, "text", "").strip()
+        # Strip padding like callback(...); by slicing between the first "("
+        # and the closing ")" instead of a regex pass over the whole body
+        head = t.find("(")
+        end = len(t) - 1 if t.endswith(";") else len(t)
+        if head > 0 and t[end - 1:end] == ")" and _JSONP_CALLBACK_RE.fullmatch(t, 0, head):
+            t = t[head + 1:end - 1]
         try:
-            return json.loads(t) 
+            return orjson.loads(t) if orjson is not None else json.loads(t)
         except Exception:
              # Try simple trailing comma fix
-             t = re.sub(r',\s*([}\]])', r'\1', t)
+             t = _TRAILING_COMMA_RE.sub(r'\1', t)
              return json.loads(t)
 
     def __getattr__(self, name):
@@ -197,6 +422,8 @@ class TLSChameleon:
         self.rate_limit = rate_limit
         self._rate_limit_last: Dict[str, float] = {}  # domain -> last request timestamp
         self.proxies_pool = proxies_pool
+        # Pool entries normalized to requests-style dicts once, not per request
+        self._proxies_pool_normalized = [_as_proxy_dict(p) for p in proxies_pool or ()]
         self.header_order = header_order
         self.http2 = http2
         self.verify = verify
@@ -206,12 +433,28 @@ class TLSChameleon:
         self._rotate_index = -1
         self._proxy_index = -1
         self.session = None
-
-        # Normalize initial proxies
-        if proxies and isinstance(proxies, str):
-            self.proxies = {"http": proxies, "https": proxies}
-        else:
-            self.proxies = proxies or {}
+        self._cipher_str: Optional[str] = None  # Cipher string of the active session
+        # (session, profile data, cipher string) by (profile_name, proxies),
+        # kept warm across rotations (LRU, see _pool_session)
+        self._sessions: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Non-randomized sessions by TLS identity, shared by profiles that
+        # only differ in headers (see _tls_identity)
+        self._tls_sessions: Dict[tuple, Any] = {}
+        self._asset_pool: Optional[ThreadPoolExecutor] = None  # Created on first _mimic_assets
+        # Recently prefetched asset URLs (LRU), skipped on later pages
+        self._prefetched: "OrderedDict[str, None]" = OrderedDict()
+        self._prefetched_lock = threading.Lock()
+        self._ordered_headers_cache: Optional[tuple] = None  # (key, headers) for _ordered_headers
+        self._backend_headers: tuple = ()  # A fresh session's own default headers
+        self._closed = threading.Event()  # Set by close() to cut retry backoff short
+        self._rng = random.Random()  # Per-instance RNG for jitter, rotation and padding
+
+        # Normalize initial proxies. With a pool, requests go through its
+        # current entry, so the session is built and keyed with that one
+        # (httpx only takes a proxy at client level).
+        self.proxies = _as_proxy_dict(proxies)
+        if self._proxies_pool_normalized:
+            self.proxies = self._current_proxy()
 
         # Initial Headers
         self.headers = headers or {}
@@ -225,28 +468,102 @@ class TLSChameleon:
 
 
 
-    def _init_session(self):
-        """Initializes or Re-initializes the underlying session (curl or httpx)"""
-        # Close existing if any
-        if self.session:
-            try:
-                self.session.close()
-            except Exception:
-                pass
+    def _session_key(self) -> tuple:
+        """Key of the pooled session for the current profile and proxy."""
+        proxies = self.proxies
+        if isinstance(proxies, dict):
+            proxies = tuple(sorted(proxies.items()))
+        return (self.profile_name, proxies or None)
 
-        # Get profile, applying randomization if enabled
+    def _tls_identity(self) -> Optional[tuple]:
+        """
+        What a session's handshake depends on, or None when every build is
+        unique (randomized profiles or shuffled ciphers).
+        """
+        if self.randomize or self.randomize_ciphers:
+            return None
         profile = _get_profile(self.profile_name)
-        
-        # Apply randomization if enabled (v2.0 feature)
-        if self.randomize and HAS_GALLERY:
-            try:
-                profile = randomize_profile(profile)
-            except Exception as e:
-                logger.debug(f"Randomization failed: {e}")
-        
-        # Cache the profile data for get_fingerprint_info()
-        self._current_profile_data = copy.deepcopy(profile)
-        
+        return (
+            profile.get("impersonate"),
+            _static_cipher_list(self.profile_name),
+            self._session_key()[1],
+            self.http2,
+        )
+
+    def _switch_session(self) -> None:
+        """
+        Make the session for the current profile/proxy active, reusing a
+        pooled one (with its warm connections and TLS tickets) if it exists.
+        A profile that only differs in headers from a pooled one borrows
+        that session instead of building its own.
+        """
+        key = self._session_key()
+        entry = self._sessions.get(key)
+        if entry is None:
+            tls_id = self._tls_identity()
+            shared = self._tls_sessions.get(tls_id)
+            if shared is None:
+                self._init_session()
+                return
+            entry = (shared, _get_profile(self.profile_name), tls_id[1])
+        self._pool_session(key, entry)
+        self.session, self._current_profile_data, self._cipher_str = entry
+        self._apply_profile_headers(self._current_profile_data)
+        self._sync_session_headers()
+
+    def _ordered_headers(self) -> Dict[str, str]:
+        """
+        Session headers in wire order and casing, rebuilt only when the
+        headers, the order rule or the profile change.
+        """
+        key = (self.profile_name, tuple(self.header_order or ()), tuple(self.headers.items()))
+        cached = self._ordered_headers_cache
+        if cached is None or cached[0] != key:
+            profile = _get_profile(self.profile_name)
+            order_rule = self.header_order or profile.get("header_order") or ()
+            cached = self._ordered_headers_cache = (
+                key,
+                self._morph_headers({}, profile),
+                profile.get("header_case", "title"),
+                frozenset(o.lower() for o in order_rule),
+            )
+        return cached[1]
+
+    def _request_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Overlay per-request headers on the ordered session template, casing
+        only the overrides. A new header the order rule places explicitly
+        needs the full layout from _morph_headers.
+        """
+        template = self._ordered_headers()
+        if not headers:
+            return template
+        case_mode, ordered = self._ordered_headers_cache[2:]
+        if not ordered and case_mode not in ("lower", "title"):
+            # Nothing to reorder or recase: the backend merges these onto
+            # the session headers, which already hold the template
+            return headers
+        merged = dict(template)
+        for k, v in headers.items():
+            ck = _case_header(k, case_mode)
+            if ck not in merged and k.lower() in ordered:
+                return self._morph_headers(headers, _get_profile(self.profile_name))
+            merged[ck] = v
+        return merged
+
+    def _sync_session_headers(self) -> None:
+        # Headers given per request are merged on top of the session's, whose
+        # key order wins, so the session must already hold them in wire order
+        headers = self.session.headers
+        headers.clear()
+        headers.update(self._ordered_headers())
+        # Backend defaults the profile doesn't set (httpx's Accept,
+        # Accept-Encoding, Connection) still go out, after the template
+        for k, v in self._backend_headers:
+            if k not in headers:
+                headers[k] = v
+
+    def _apply_profile_headers(self, profile: Mapping[str, Any]) -> None:
         user_agent = profile.get("user_agent")
         
         # Always update User-Agent to match the current profile (AI-Urllib4 Adaptive Fix)
@@ -261,12 +578,48 @@ class TLSChameleon:
         if profile.get("sec_ch_ua_mobile"):
             self.headers["Sec-CH-UA-Mobile"] = profile.get("sec_ch_ua_mobile", "?0")
 
-        if self.engine == "curl" and crequests is not None:
+    def _init_session(self):
+        """Initializes or Re-initializes the underlying session (curl or httpx)"""
+        # Replace the pooled session for this profile/proxy, if any. Sessions
+        # pooled under other keys stay open for reuse by _switch_session().
+        key = self._session_key()
+        old = self._sessions.pop(key, None)
+        if old is not None:
+            self._discard_session(old[0])
+
+        # Get profile, applying randomization if enabled
+        profile = _get_profile(self.profile_name)
+        
+        # Apply randomization if enabled (v2.0 feature)
+        randomized = False
+        if self.randomize and HAS_GALLERY:
+            try:
+                profile = randomize_profile(profile)
+                randomized = True
+            except Exception as e:
+                logger.debug(f"Randomization failed: {e}")
+        
+        # Cache the profile data for get_fingerprint_info(). The cached
+        # profile is a read-only view and a randomized variant is already
+        # private, so neither needs copying.
+        self._current_profile_data = profile
+        
+        self._apply_profile_headers(profile)
+
+        # Only a shuffle or a randomized variant needs a freshly built cipher
+        # string; otherwise it's fixed per profile name
+        if self.randomize_ciphers or randomized:
+            cipher_str = _cipher_list(profile, self.randomize_ciphers, self._rng)
+        else:
+            cipher_str = _static_cipher_list(self.profile_name)
+
+        crequests, ccurl = _get_curl() if self.engine == "curl" else (None, None)
+        httpx = _get_httpx() if self.engine == "httpx" else None
+        if crequests is not None:
             impersonate = profile.get("impersonate")
             
             # Helper to build options
             curl_opts = {}
-            cipher_str = _cipher_list(profile, self.randomize_ciphers)
             if cipher_str and ccurl and hasattr(ccurl, "CURLOPT_SSL_CIPHER_LIST"):
                 curl_opts[ccurl.CURLOPT_SSL_CIPHER_LIST] = cipher_str
 
@@ -275,8 +628,9 @@ class TLSChameleon:
                 timeout=self.timeout,
                 curl_options=curl_opts
             )
+            self._backend_headers = tuple(self.session.headers.items())
             # Apply headers
-            self.session.headers.update(self.headers)
+            self._sync_session_headers()
             # Apply proxies 
             if self.proxies:
                 self.session.proxies.update(self.proxies)
@@ -285,33 +639,64 @@ class TLSChameleon:
             
             # Note: curls_cffi Session handles cookies automatically
 
-        elif self.engine == "httpx" and httpx is not None:
+        elif httpx is not None:
             # Build SSL context with cipher configuration
-            ssl_context = ssl.create_default_context()
-            if not self.verify:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            
-            cipher_str = _cipher_list(profile, self.randomize_ciphers)
-            if cipher_str:
-                try:
-                    ssl_context.set_ciphers(cipher_str)
-                except Exception as e:
-                    logger.debug(f"Failed to set ciphers for httpx: {e}")
+            if self.randomize_ciphers:
+                # Shuffled per session, not worth caching
+                ssl_context = _build_ssl_context(cipher_str, self.verify)
+            else:
+                ssl_context = _cached_ssl_context(cipher_str, self.verify)
             
-            # Create client with the configured SSL context
+            # Create client with the configured SSL context. httpx fixes the
+            # proxy at construction (the pool's current entry, if there is
+            # a pool); the client is pooled per proxy anyway.
+            proxies = self._current_proxy()
             self.session = httpx.Client(
-                http2=bool(self.http2) if self.http2 is not None else False,
+                http2=_httpx_http2(self.http2),
                 timeout=self.timeout,
                 verify=ssl_context,
+                proxy=(proxies.get("https") or proxies.get("http")) if proxies else None,
                 follow_redirects=True
             )
-            self.session.headers.update(self.headers)
-            if self.proxies:
-                self.session.proxies = self._normalize_proxy_for_httpx(self.proxies)
+            self._backend_headers = tuple(self.session.headers.items())
+            self._sync_session_headers()
         else:
             raise RuntimeError(f"Engine {self.engine} not available.")
 
+        self._cipher_str = cipher_str
+        self._pool_session(key, (self.session, self._current_profile_data, cipher_str))
+        if not randomized:
+            tls_id = self._tls_identity()
+            if tls_id is not None:
+                self._tls_sessions[tls_id] = self.session
+
+    def _pool_session(self, key: tuple, entry: tuple) -> None:
+        """
+        Pool `entry` under `key` as the most recently used, closing the least
+        recently used sessions beyond _MAX_POOLED_SESSIONS.
+        """
+        sessions = self._sessions
+        sessions[key] = entry
+        sessions.move_to_end(key)
+        while len(sessions) > _MAX_POOLED_SESSIONS:
+            old_key, old = next(iter(sessions.items()))
+            if old[0] is entry[0]:
+                # Another key for the session being pooled: just drop the alias
+                del sessions[old_key]
+            else:
+                self._discard_session(old[0])
+
+    def _discard_session(self, session: Any) -> None:
+        """Close a pooled session and forget every key sharing it."""
+        for k in [k for k, entry in self._sessions.items() if entry[0] is session]:
+            del self._sessions[k]
+        for k in [k for k, s in self._tls_sessions.items() if s is session]:
+            del self._tls_sessions[k]
+        try:
+            session.close()
+        except Exception:
+            pass
+
     def __enter__(self):
         return self
 
@@ -319,16 +704,24 @@ class TLSChameleon:
         self.close()
 
     def close(self):
+        self._closed.set()
+        if self._asset_pool is not None:
+            self._asset_pool.shutdown(wait=False)
+            self._asset_pool = None
+        sessions = {id(entry[0]): entry[0] for entry in self._sessions.values()}
         if self.session:
-            self.session.close()
+            sessions[id(self.session)] = self.session
+        self._sessions.clear()
+        self._tls_sessions.clear()
+        for session in sessions.values():
+            try:
+                session.close()
+            except Exception:
+                pass
     
     def _profile_exists(self, name: str) -> bool:
         """Check if a profile exists in either legacy or gallery profiles."""
-        if name in PROFILES:
-            return True
-        if HAS_GALLERY and name in FINGERPRINT_GALLERY:
-            return True
-        return False
+        return name in _PROFILE_NAMES
     
     def get_fingerprint_info(self) -> Dict[str, Any]:
         """
@@ -377,13 +770,17 @@ class TLSChameleon:
         if user_agent:
             self.headers["User-Agent"] = user_agent
         
+        # Reinitialize session to apply changes
+        self._init_session()
+
         # Note: JA3 is determined by curl_cffi's impersonate setting
         # We can't directly set JA3, but we can store it for reference
+        # (on a copy, as the profile data may be a shared read-only view)
         if ja3 and self._current_profile_data:
-            self._current_profile_data["ja3"] = ja3
-        
-        # Reinitialize session to apply changes
-        self._init_session()
+            self._current_profile_data = {**self._current_profile_data, "ja3": ja3}
+            self._sessions[self._session_key()] = (
+                self.session, self._current_profile_data, self._cipher_str
+            )
 
     def request(self, method: str, url: str, **kwargs: Any):
         # Domain Memory Check (Adaptive Profile Selection)
@@ -400,8 +797,14 @@ class TLSChameleon:
         # 1. Randomize Ciphers (if curl) -> Handled in _init_session
         # 2. Header Ordering
         
-        # Prepare kwargs for the delegated call
-        request_kwargs = kwargs.copy()
+        # Prepare kwargs for the delegated call. **kwargs is already a fresh
+        # dict, so our own extras are popped from it once, up front.
+        request_kwargs = kwargs
+        # Per-call override of the block policy (e.g. "none" to handle retries yourself)
+        on_block = request_kwargs.pop("on_block", self.on_block)
+        # Session.request doesn't take curl_options
+        request_kwargs.pop("curl_options", None)
+        mimic_assets = request_kwargs.pop("mimic_assets", False)
         
         # Rate limiting per domain
         if self.rate_limit and self.rate_limit > 0:
@@ -413,36 +816,30 @@ class TLSChameleon:
             self._rate_limit_last[domain] = time.time()
         
         # Merge headers
-        req_headers = request_kwargs.pop("headers", {}) or {}
+        user_headers = request_kwargs.pop("headers", None) or {}
         
         # 1. Header Morphing (Ordering & Casing)
-        profile = _get_profile(self.profile_name)
-        req_headers = self._morph_headers(req_headers, profile)
+        req_headers = self._request_headers(user_headers)
 
         # 2. Ghost Mode (Traffic Shaping)
         if self.ghost_mode:
             self._apply_ghost_mode(method, url, request_kwargs)
 
+        # Settle the per-call policy once rather than on every attempt
+        # httpx only takes proxies at client level (see _init_session).
+        per_attempt_proxy = self.engine == "curl"
+        rotate_profile = on_block in {"rotate", "both"}
+        rotate_proxy = on_block in {"proxy", "both"}
+
+        # The proxy only changes when a block rotates it, so it's passed
+        # once here and refreshed after a rotation rather than every attempt
+        if per_attempt_proxy:
+            self._pass_current_proxy(request_kwargs)
+
         attempt = 0
+        backoff = None  # Delay schedule, built on the first retry only
         while True:
-            # Proxy Rotation logic for this specific request attempt? 
-            # If we Rotate Proxy, we usually update the Session's proxy or pass it in kwargs.
-            current_proxy = self._current_proxy()
-            if current_proxy and current_proxy != self.proxies:
-                 # Override session proxy for this request
-                 if self.engine == "curl":
-                     request_kwargs["proxies"] = current_proxy
-                 else:
-                     request_kwargs["proxies"] = self._normalize_proxy_for_httpx(current_proxy)
-
             try:
-                # Remove curl_options from kwargs if present (since Session.request doesn't take it)
-                if "curl_options" in request_kwargs:
-                    request_kwargs.pop("curl_options")
-                
-                # Check for mimic_assets
-                mimic_assets = request_kwargs.pop("mimic_assets", False)
-
                 resp = self.session.request(method, url, headers=req_headers, **request_kwargs)
                 
                 # Wrap response
@@ -482,25 +879,29 @@ class TLSChameleon:
             
             # Blocking Logic
             attempt += 1
-            if self.on_block in {"rotate", "both"}:
+            if rotate_profile:
                 self._rotate_profile()
-                # Re-init session to apply new profile (User-Agent, JA3/Impersonate)
-                self._init_session()
                 
-            if self.on_block in {"proxy", "both"}:
+            if rotate_proxy:
                 self._rotate_proxy()
-                # Proxy is applied in next loop iteration via _current_proxy() override 
-                # OR we should update self.proxies and re-init. 
                 # Let's update self.proxies to be sticky
-                self.proxies = self._current_proxy()
-                if self.engine == "curl":
-                    self.session.proxies.update(self.proxies or {})
-                # For httpx we'd need to set .proxies, but it's immutable-ish. Re-init is safer.
-                if self.engine == "httpx":
-                     self._init_session()
-
-            delay = self.retry_backoff_base * (2 ** (attempt - 1))
-            jitter = random.uniform(0, self.retry_jitter)
+                self.proxies = self._current_proxy() or {}
+                if per_attempt_proxy:
+                    self._pass_current_proxy(request_kwargs)
+
+            if rotate_profile or rotate_proxy:
+                # Switch to the session for the new profile/proxy (User-Agent,
+                # JA3/Impersonate), reusing a warm one from an earlier rotation
+                self._switch_session()
+                # The new profile's User-Agent etc. must reach the retry too
+                req_headers = self._request_headers(user_headers)
+
+            if backoff is None:
+                backoff = tuple(
+                    self.retry_backoff_base * (1 << i) for i in range(max(self.max_retries, 1))
+                )
+            delay = backoff[min(attempt, len(backoff)) - 1]
+            jitter = self._rng.random() * self.retry_jitter
             
             # Call on_retry hook if set
             if self.on_retry:
@@ -509,7 +910,9 @@ class TLSChameleon:
                 except Exception as e:
                     logger.debug(f"on_retry hook error: {e}")
             
-            time.sleep(delay + jitter)
+            # Interruptible by close(): give back the last response right away
+            if self._closed.wait(delay + jitter):
+                return resp
 
     def _is_block(self, resp: Any) -> bool:
         if not resp:
@@ -523,36 +926,44 @@ class TLSChameleon:
         
         # Standard checks
         code = getattr(resp, "status_code", None)
-        if code in {403, 429, 1020}:
+        if code in _BLOCK_CODES:
             return True
         
         # Only check body keywords on non-2xx responses to avoid false-positives
         if code is not None and 200 <= code < 300:
             return False
             
+        # Block markers live in the <title>/first block of error pages, so
+        # only peek at the head of the body instead of decoding all of it
         text = ""
         try:
-            text = getattr(resp, "text", "") or ""
+            raw = getattr(resp, "content", None)
+            if isinstance(raw, (bytes, bytearray)):
+                # The keywords are ASCII, so latin-1 (a plain byte widening,
+                # no UTF-8 validation) finds exactly the same matches
+                text = raw[:_BLOCK_PEEK_BYTES].decode("latin-1")
+            else:
+                text = (getattr(resp, "text", "") or "")[:_BLOCK_PEEK_BYTES]
         except Exception:
             text = ""
-        t = text.lower()
-        if any(x in t for x in ["access denied", "error 1020", "attention required", "bot detected"]):
-            return True
-        return False
+        # One case-insensitive scan instead of lower() + a scan per keyword
+        return _BLOCK_RE.search(text) is not None
 
     def _rotate_profile(self) -> None:
         if self.rotate_profiles:
             self._rotate_index = (self._rotate_index + 1) % len(self.rotate_profiles)
             name = self.rotate_profiles[self._rotate_index]
         else:
-            # Draw from both legacy and gallery profiles
-            all_profiles = set(PROFILES.keys())
-            if HAS_GALLERY:
-                all_profiles.update(FINGERPRINT_GALLERY.keys())
-            names = [n for n in all_profiles if n != self.profile_name]
-            if not names:
+            # Draw from both legacy and gallery profiles (cached name tuple),
+            # redrawing on the rare hit of the current profile
+            names = _available_profiles()
+            n = len(names)
+            if n == 0 or (n == 1 and names[0] == self.profile_name):
                 return
-            name = random.choice(names)
+            while True:
+                name = names[self._rng.randrange(n)]
+                if name != self.profile_name:
+                    break
         
         self.profile_name = name
         # User-Agent update happens in _init_session calling _get_profile
@@ -563,37 +974,34 @@ class TLSChameleon:
         self._proxy_index = (self._proxy_index + 1) % len(self.proxies_pool)
 
     def _current_proxy(self):
-        if self.proxies_pool and len(self.proxies_pool) > 0:
+        pool = self._proxies_pool_normalized
+        if pool:
             if self._proxy_index < 0:
                 self._proxy_index = 0
-            return self.proxies_pool[self._proxy_index]
+            return pool[self._proxy_index]
         return self.proxies or None
 
-    def _normalize_proxy_for_httpx(self, proxy):
-        if proxy is None:
-            return None
-        if isinstance(proxy, str):
-            return {"http://": proxy, "https://": proxy} # HTMX usually prefers protocol
-        if isinstance(proxy, dict):
-            # mapping requests style to httpx style can be tricky (http -> http://)
-            # but httpx handles dicts reasonably well now.
-            return proxy
-        return None
+    def _pass_current_proxy(self, request_kwargs: Dict[str, Any]) -> None:
+        # Override session proxy for this request
+        current_proxy = self._current_proxy()
+        if current_proxy:
+            request_kwargs["proxies"] = current_proxy
 
     def _apply_site_preset(self, site: str) -> None:
-        s = site.lower()
-        if s == "cloudflare":
-            if not self.rotate_profiles:
-                self.rotate_profiles = ["chrome_124", "chrome_120", "mobile_safari_17"]
-            self.max_retries = max(self.max_retries, 3)
-            self.retry_backoff_base = min(self.retry_backoff_base, 0.8)
-            self.retry_jitter = max(self.retry_jitter, 0.4)
-            if self.http2 is None:
-                self.http2 = True
-            if not self.header_order:
-                self.header_order = ["User-Agent", "Accept", "Accept-Language", "Accept-Encoding", "Connection"]
-
-    def _morph_headers(self, headers: Dict[str, str], profile: Dict[str, Any]) -> Dict[str, str]:
+        preset = _SITE_PRESETS.get(site.lower())
+        if preset is None:
+            return
+        if not self.rotate_profiles:
+            self.rotate_profiles = list(preset["rotate_profiles"])
+        self.max_retries = max(self.max_retries, preset["max_retries"])
+        self.retry_backoff_base = min(self.retry_backoff_base, preset["retry_backoff_base"])
+        self.retry_jitter = max(self.retry_jitter, preset["retry_jitter"])
+        if self.http2 is None:
+            self.http2 = preset["http2"]
+        if not self.header_order and preset["header_order"]:
+            self.header_order = list(preset["header_order"])
+
+    def _morph_headers(self, headers: Dict[str, str], profile: Mapping[str, Any]) -> Dict[str, str]:
         """Applies casing and ordering to headers based on profile settings."""
         if not profile:
             return headers
@@ -606,28 +1014,22 @@ class TLSChameleon:
         order_rule = self.header_order or profile.get("header_order")
         
         morphed = {}
-        
-        def case_key(k: str) -> str:
-            if case_mode == "lower":
-                return k.lower()
-            if case_mode == "title":
-                return "-".join(word.capitalize() for word in k.split("-"))
-            return k
 
         # Apply order if specified
         if order_rule:
-            # Normalize order rule to lowercase for matching
-            norm_order = [o.lower() for o in order_rule]
+            # Case-insensitive lookup of the merged keys (first spelling wins)
+            by_lower = {}
+            for k in merged:
+                by_lower.setdefault(k.lower(), k)
             # Add known ordered headers first
-            for key in norm_order:
-                # Find matching key in merged (case insensitive)
-                found_key = next((k for k in merged if k.lower() == key), None)
-                if found_key:
-                    morphed[case_key(found_key)] = merged.pop(found_key)
+            for key in order_rule:
+                found_key = by_lower.pop(key.lower(), None)
+                if found_key is not None:
+                    morphed[_case_header(found_key, case_mode)] = merged.pop(found_key)
         
         # Add remaining headers
         for k, v in merged.items():
-            morphed[case_key(k)] = v
+            morphed[_case_header(k, case_mode)] = v
             
         return morphed
 
@@ -635,17 +1037,18 @@ class TLSChameleon:
         """Simulates human behavior and masks traffic patterns."""
         # 1. Timing Jitter (Poisson distribution representation)
         # Random delay between 0.1 and 1.5 seconds for every request if ghost_mode is on
-        delay = random.expovariate(1.0 / 0.5) # Average 0.5s delay
+        delay = self._rng.expovariate(1.0 / 0.5) # Average 0.5s delay
         delay = min(max(delay, 0.1), 3.0) # Clamp
-        time.sleep(delay)
+        # The wait dwarfs drawing the delay; let close() cut it short
+        self._closed.wait(delay)
         
         # 2. Payload Padding for POST/PUT
         if method.upper() in ("POST", "PUT"):
             data = kwargs.get("data")
             json_data = kwargs.get("json")
             
-            padding_key = f"_{random.getrandbits(16):x}"
-            padding_val = "".join(random.choices("abcdefghijklmnopqrstuvwxyz0123456789", k=random.randint(8, 32)))
+            padding_key = f"_{self._rng.getrandbits(16):x}"
+            padding_val = os.urandom(self._rng.randint(8, 32)).translate(_PADDING_TABLE).decode()
             
             if isinstance(data, dict):
                 data[padding_key] = padding_val
@@ -654,8 +1057,12 @@ class TLSChameleon:
 
     def _check_waf_and_adapt(self, resp: Any) -> None:
         """Detects WAF and automatically adapts session settings."""
-        headers = {k.lower(): v for k, v in getattr(resp, "headers", {}).items()}
-        server = headers.get("server", "").lower()
+        headers = getattr(resp, "headers", None) or {}
+        # curl_cffi and httpx headers already look up case-insensitively;
+        # only a plain dict (e.g. from a custom response) needs lowering
+        if isinstance(headers, dict):
+            headers = {k.lower(): v for k, v in headers.items()}
+        server = (headers.get("server") or "").lower()
         
         waf_detected = None
         if "cloudflare" in server or "cf-ray" in headers:
@@ -679,10 +1086,9 @@ class TLSChameleon:
             pass
 
     def _rotate_to_modern_chrome(self) -> None:
-        chromes = [n for n in PROFILES.keys() if "chrome" in n]
-        if chromes:
-            self.profile_name = random.choice(chromes)
-            self._init_session()
+        if _CHROME_PROFILE_NAMES:
+            self.profile_name = self._rng.choice(_CHROME_PROFILE_NAMES)
+            self._switch_session()
 
     def export_session(self) -> Dict[str, Any]:
         """Returns the full state of the session for persistence."""
@@ -718,65 +1124,57 @@ class TLSChameleon:
         if not self.session:
             return
 
+        # Identify the iterator that yields actual Cookie objects
+        # httpx.Cookies iterates keys (strings), but has .jar (CookieJar)
+        # requests/curl_cffi RequestCookieJar iterates cookies
+        jar = self.session.cookies
+        # Snapshot once so the jar is walked a single time. Go through iter():
+        # list() would first call CookieJar.__len__, itself a full walk.
+        cookies = list(iter(getattr(jar, "jar", jar)))
+
         if format == "netscape":
             cj = http.cookiejar.MozillaCookieJar(filename)
-            
-            # Identify the iterator that yields actual Cookie objects
-            # httpx.Cookies iterates keys (strings), but has .jar (CookieJar)
-            # requests/curl_cffi RequestCookieJar iterates cookies
-            if hasattr(self.session.cookies, "jar"):
-                cookie_iterator = self.session.cookies.jar
-            else:
-                cookie_iterator = self.session.cookies
 
-            for cookie in cookie_iterator:
+            for cookie in cookies:
                 # Check if it's already a http.cookiejar.Cookie (requests/curl_cffi usually)
                 if isinstance(cookie, http.cookiejar.Cookie):
                     cj.set_cookie(cookie)
                 else:
                     # Convert generic object (like httpx.Cookie) to http.cookiejar.Cookie
-                    c = http.cookiejar.Cookie(
-                        version=0, 
-                        name=getattr(cookie, "name", ""), 
+                    cj.set_cookie(_make_cookie(
+                        name=getattr(cookie, "name", ""),
                         value=getattr(cookie, "value", ""),
-                        port=None, 
-                        port_specified=False,
-                        domain=getattr(cookie, "domain", ""), 
-                        domain_specified=bool(getattr(cookie, "domain", "")), 
-                        domain_initial_dot=False,
-                        path=getattr(cookie, "path", "/"), 
-                        path_specified=bool(getattr(cookie, "path", "/")),
+                        domain=getattr(cookie, "domain", ""),
+                        path=getattr(cookie, "path", "/"),
                         secure=getattr(cookie, "secure", False),
                         expires=getattr(cookie, "expires", None),
-                        discard=False,
-                        comment=None,
-                        comment_url=None,
-                        rest={"HttpOnly": getattr(cookie, "http_only", False)},
-                        rfc2109=False,
-                    )
-                    cj.set_cookie(c)
+                        http_only=getattr(cookie, "http_only", False),
+                    ))
                     
             cj.save(ignore_discard=True, ignore_expires=True)
             
         elif format == "json":
-            cookies_list = []
-            
-            if hasattr(self.session.cookies, "jar"):
-                cookie_iterator = self.session.cookies.jar
-            else:
-                cookie_iterator = self.session.cookies
-
-            for cookie in cookie_iterator:
-                cookies_list.append({
+            cookies_list = [
+                # http.cookiejar.Cookie always has every field; other cookie
+                # objects fall back to per-field defaults
+                dict(zip(_COOKIE_FIELDS, _get_cookie_fields(cookie)))
+                if isinstance(cookie, http.cookiejar.Cookie)
+                else {
                     "name": getattr(cookie, "name", ""),
                     "value": getattr(cookie, "value", ""),
                     "domain": getattr(cookie, "domain", ""),
                     "path": getattr(cookie, "path", "/"),
                     "secure": getattr(cookie, "secure", False),
                     "expires": getattr(cookie, "expires", None)
-                })
-            with open(filename, "w") as f:
-                json.dump(cookies_list, f, indent=2)
+                }
+                for cookie in cookies
+            ]
+            if orjson is not None:
+                with open(filename, "wb") as f:
+                    f.write(orjson.dumps(cookies_list))
+            else:
+                with open(filename, "w") as f:
+                    json.dump(cookies_list, f, separators=(",", ":"))
         else:
             raise ValueError(f"Unknown cookie format: {format}")
 
@@ -797,27 +1195,40 @@ class TLSChameleon:
         if format == "netscape":
             cj = http.cookiejar.MozillaCookieJar(filename)
             cj.load(ignore_discard=True, ignore_expires=True)
-            for cookie in cj:
-                self.session.cookies.set(
-                    cookie.name, 
-                    cookie.value, 
-                    domain=cookie.domain, 
-                    path=cookie.path
-                )
+            cookies = list(cj)
                 
         elif format == "json":
             with open(filename, "r") as f:
                 cookies_list = json.load(f)
-                for c in cookies_list:
-                    self.session.cookies.set(
-                        c["name"],
-                        c["value"],
-                        domain=c.get("domain"),
-                        path=c.get("path", "/")
-                    )
+            cookies = [
+                _make_cookie(
+                    name=c["name"],
+                    value=c["value"],
+                    domain=c.get("domain") or "",
+                    path=c.get("path", "/"),
+                    secure=c.get("secure", False),
+                    expires=c.get("expires"),
+                )
+                for c in cookies_list
+            ]
         else:
             raise ValueError(f"Unknown cookie format: {format}")
 
+        # Insert the Cookie objects straight into the underlying jar, which
+        # keeps secure/expires/HttpOnly (cookies.set() only takes name/value/domain/path)
+        jar = getattr(self.session.cookies, "jar", None)
+        if jar is not None and hasattr(jar, "set_cookie"):
+            for cookie in cookies:
+                jar.set_cookie(cookie)
+        else:
+            for cookie in cookies:
+                self.session.cookies.set(
+                    cookie.name, 
+                    cookie.value, 
+                    domain=cookie.domain, 
+                    path=cookie.path
+                )
+
     def submit_form(self, url: str, data: Dict[str, str], form_selector: int = 0, **kwargs):
         """
         Automatically finds forms on the page, fills them with 'data', and submits.
@@ -863,35 +1274,146 @@ class TLSChameleon:
         elif reading_speed == "slow":
             base = 2.5
         
-        delay = random.uniform(base, base * 2.0)
+        delay = self._rng.uniform(base, base * 2.0)
         time.sleep(delay)
 
     def _mimic_assets(self, html: str, base_url: str) -> None:
         """
-        Fetches static resources (CSS, JS, Images) in background threads without waiting.
+        Fetches static resources (CSS, JS, Images) in the background without waiting.
         """
-        # Simple extraction
-        assets = set()
-        assets.update(re.findall(r'<link.*?href=["\'](.*?)["\']', html))
-        assets.update(re.findall(r'<script.*?src=["\'](.*?)["\']', html))
-        assets.update(re.findall(r'<img.*?src=["\'](.*?)["\']', html))
+        # Consume the match stream in document order and stop at the cap, so
+        # large pages are not scanned (or materialized) past the assets we use
+        # URLs prefetched for an earlier page would be browser-cache hits,
+        # so they are skipped (and refreshed in the LRU) rather than re-sent
+        urls: List[str] = []
+        seen = set()
+        prefetched = self._prefetched
+        with self._prefetched_lock:
+            for asset in _iter_assets(html):
+                if asset in seen:
+                    continue
+                seen.add(asset)
+                url = urljoin(base_url, asset)
+                if url in prefetched:
+                    prefetched.move_to_end(url)
+                    continue
+                prefetched[url] = None
+                urls.append(url)
+                if len(urls) >= _MAX_MIMIC_ASSETS:
+                    break
+            while len(prefetched) > _MAX_PREFETCHED_ASSETS:
+                prefetched.popitem(last=False)
         
-        def fetch(u):
-            try:
-                full_url = urljoin(base_url, u)
-                # Head request to look like prefetch, or GET
-                # Use a lightweight request to mimic asset prefetch
-                self.session.head(full_url, timeout=5)
-            except Exception:
-                pass
+        if not urls:
+            return
 
-        # Limit to first N assets to avoid flooding?
-        # Browser fetches many in parallel.
-        # We spawn threads
-        for asset in list(assets)[:20]: # Cap at 20 assets
-            t = threading.Thread(target=fetch, args=(asset,))
-            t.daemon = True
-            t.start()
+        # One background job per page: the HEADs are multiplexed on a single
+        # event loop (and connection, over HTTP/2) instead of blocking a
+        # thread each. The pool keeps that event loop off the caller's thread.
+        if self._asset_pool is None:
+            self._asset_pool = ThreadPoolExecutor(
+                max_workers=_MIMIC_ASSET_WORKERS, thread_name_prefix="chameleon-asset"
+            )
+        import asyncio
+
+        # Snapshot the session state now, so a rotation before the job
+        # starts can't change what the prefetch looks like
+        self._asset_pool.submit(
+            asyncio.run,
+            self._mimic_assets_async(
+                urls,
+                headers=dict(self._ordered_headers()),
+                proxies=self.proxies or None,
+                cookies=self._cookie_snapshot(),
+                profile=self._current_profile_data or {},
+                cipher_str=self._cipher_str,
+            ),
+        )
+
+    def _cookie_snapshot(self) -> Optional[http.cookiejar.CookieJar]:
+        """A copy of the session's cookie jar, safe to hand to another thread."""
+        cookies = getattr(self.session, "cookies", None)
+        if cookies is None:
+            return None
+        snapshot = http.cookiejar.CookieJar()
+        # httpx.Cookies iterates names; the Cookie objects live in .jar
+        for cookie in list(iter(getattr(cookies, "jar", cookies))):
+            snapshot.set_cookie(cookie)
+        return snapshot
+
+    async def _mimic_assets_async(
+        self,
+        urls: List[str],
+        headers: Dict[str, str],
+        proxies: Optional[Dict[str, str]],
+        cookies: Any,
+        profile: Mapping[str, Any],
+        cipher_str: Optional[str],
+    ) -> None:
+        """
+        Sends HEAD requests for `urls` concurrently from one async client
+        that mirrors the given session state (impersonation, cipher list,
+        headers, proxies, cookies), so the prefetch has the page's TLS fingerprint.
+        Like a browser, at most _MIMIC_ORIGIN_CONNECTIONS are in flight per
+        origin: over HTTP/2 they share one connection, over HTTP/1.1 this caps
+        the handshakes instead of opening one per asset.
+        """
+
+        import asyncio
+
+        limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def head(client, url: str) -> None:
+            parts = urlparse(url)
+            origin = f"{parts.scheme}://{parts.netloc}"
+            limit = limits.get(origin)
+            if limit is None:
+                limit = limits[origin] = asyncio.Semaphore(_MIMIC_ORIGIN_CONNECTIONS)
+            async with limit:
+                await client.head(url, timeout=5)
+
+        async def head_all(client) -> None:
+            # Errors are irrelevant for prefetch, don't let one cancel the rest
+            await asyncio.gather(
+                *(head(client, u) for u in urls), return_exceptions=True
+            )
+
+        crequests, ccurl = _get_curl() if self.engine == "curl" else (None, None)
+        httpx = _get_httpx() if self.engine == "httpx" else None
+        try:
+            if crequests is not None:
+                curl_opts = {}
+                if cipher_str and ccurl and hasattr(ccurl, "CURLOPT_SSL_CIPHER_LIST"):
+                    curl_opts[ccurl.CURLOPT_SSL_CIPHER_LIST] = cipher_str
+                async with crequests.AsyncSession(
+                    impersonate=profile.get("impersonate"),
+                    timeout=self.timeout,
+                    curl_options=curl_opts,
+                    headers=headers,
+                    proxies=proxies,
+                    cookies=cookies,
+                    verify=self.verify,
+                ) as client:
+                    await head_all(client)
+            elif httpx is not None:
+                proxy = proxies.get("https") or proxies.get("http") if proxies else None
+                # Same cipher list as the session (shuffled ones aren't cached)
+                if self.randomize_ciphers:
+                    ssl_context = _build_ssl_context(cipher_str, self.verify)
+                else:
+                    ssl_context = _cached_ssl_context(cipher_str, self.verify)
+                async with httpx.AsyncClient(
+                    http2=_httpx_http2(self.http2),
+                    timeout=self.timeout,
+                    headers=headers,
+                    proxy=proxy,
+                    cookies=cookies,
+                    verify=ssl_context,
+                    follow_redirects=True,
+                ) as client:
+                    await head_all(client)
+        except Exception as e:
+            logger.debug(f"Asset prefetch failed: {e}")
 
     # Method aliases for compatibility
     def get(self, url: str, **kwargs: Any):
@@ -916,9 +1438,10 @@ class TLSChameleon:
         return self.request("OPTIONS", url, **kwargs)
 
 
-# Module-level convenience functions (non-persistent session unless cached?)
+# Module-level convenience functions.
 # Standard requests behavior is: requests.get() creates a NEW session/request every time.
-# We will match that.
+# We keep the per-call semantics (no cookies carried between calls) but reuse
+# the underlying client, so repeated calls skip the TLS handshake and pool setup.
 
 # Session-level kwargs are separated from request-level kwargs
 _SESSION_KWARGS = {
@@ -929,6 +1452,12 @@ _SESSION_KWARGS = {
     'site', 'proxies_pool', 'header_order', 'http2', 'verify', 'ghost_mode',
 }
 
+# LRU of live clients used by the convenience functions, keyed by owning
+# thread first; each thread keeps at most _SESSION_CACHE_MAXSIZE of its own
+_SESSION_CACHE: "OrderedDict[tuple, TLSChameleon]" = OrderedDict()
+_SESSION_CACHE_LOCK = threading.Lock()
+_SESSION_CACHE_MAXSIZE = 16
+
 def _split_kwargs(kwargs: Dict[str, Any]):
     """Split kwargs into session-level and request-level."""
     session_kw = {}
@@ -940,45 +1469,118 @@ def _split_kwargs(kwargs: Dict[str, Any]):
             request_kw[k] = v
     return session_kw, request_kw
 
-def request(method: str, url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+def _freeze(value: Any) -> Any:
+    """Hashable form of a session kwarg value (dicts/lists become tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    hash(value)  # Raises TypeError for anything else unhashable
+    return value
+
+def _get_cached_client(fingerprint: Optional[str], session_kw: Dict[str, Any]) -> Optional[TLSChameleon]:
+    """
+    Return a cached client for these session settings, creating it if needed.
+    
+    Clients are per thread, since request() mutates client state on rotation.
+    A thread only ever evicts its own clients (or those of threads that have
+    exited), so it can't close one another thread is in the middle of using.
+    Returns None if the settings can't be used as a cache key.
+    """
+    owner = threading.current_thread()
+    try:
+        key = (owner, fingerprint, _freeze(session_kw))
+    except TypeError:
+        return None
+    
+    with _SESSION_CACHE_LOCK:
+        client = _SESSION_CACHE.get(key)
+        if client is not None:
+            _SESSION_CACHE.move_to_end(key)
+            return client
+    
+    client = TLSChameleon(fingerprint=fingerprint, **session_kw)
+    evicted = []
+    with _SESSION_CACHE_LOCK:
+        _SESSION_CACHE[key] = client
+        # Oldest first, so the first surplus entries are the ones to go
+        own = [k for k in _SESSION_CACHE if k[0] is owner]
+        stale = own[:max(len(own) - _SESSION_CACHE_MAXSIZE, 0)]
+        stale += [k for k in _SESSION_CACHE if not k[0].is_alive()]
+        for k in stale:
+            evicted.append(_SESSION_CACHE.pop(k))
+    for old in evicted:
+        old.close()
+    return client
+
+def _rotation_state(client: TLSChameleon) -> tuple:
+    """What a block rotation or domain-memory switch changes on a client."""
+    return (
+        id(client.session), client.profile_name, client._rotate_index, client._proxy_index,
+    )
+
+def _drop_cached_client(client: TLSChameleon) -> None:
+    """Remove `client` from the cache and close it."""
+    with _SESSION_CACHE_LOCK:
+        for k in [k for k, c in _SESSION_CACHE.items() if c is client]:
+            del _SESSION_CACHE[k]
+    client.close()
+
+def close_cached_sessions() -> None:
+    """Close the clients cached by the module-level request functions."""
+    with _SESSION_CACHE_LOCK:
+        clients = list(_SESSION_CACHE.values())
+        _SESSION_CACHE.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+atexit.register(close_cached_sessions)
+
+def _call(method: str, url: str, fingerprint: Optional[str], kwargs: Dict[str, Any], *args: Any):
     session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.request(method, url, **request_kw)
+    client = _get_cached_client(fingerprint, session_kw)
+    if client is None:
+        with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
+            return getattr(client, method)(*args, url, **request_kw)
+    state = _rotation_state(client)
+    try:
+        return getattr(client, method)(*args, url, **request_kw)
+    finally:
+        if _rotation_state(client) != state:
+            # The call moved to another profile/proxy (and may have pooled
+            # sessions holding cookies); the next call must start from the
+            # settings it asked for, so this client is not reused
+            _drop_cached_client(client)
+        elif client.session is not None:
+            # Like requests.get(), don't carry cookies over to the next call
+            client.session.cookies.clear()
+
+def request(method: str, url: str, fingerprint: Optional[str] = None, **kwargs: Any):
+    return _call("request", url, fingerprint, kwargs, method)
 
 def get(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
-    session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.get(url, **request_kw)
+    return _call("get", url, fingerprint, kwargs)
 
 def post(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
-    session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.post(url, **request_kw)
+    return _call("post", url, fingerprint, kwargs)
 
 def put(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
-    session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.put(url, **request_kw)
+    return _call("put", url, fingerprint, kwargs)
 
 def delete(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
-    session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.delete(url, **request_kw)
+    return _call("delete", url, fingerprint, kwargs)
 
 def head(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
-    session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.head(url, **request_kw)
+    return _call("head", url, fingerprint, kwargs)
 
 def patch(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
-    session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.patch(url, **request_kw)
+    return _call("patch", url, fingerprint, kwargs)
 
 def options(url: str, fingerprint: Optional[str] = None, **kwargs: Any):
-    session_kw, request_kw = _split_kwargs(kwargs)
-    with TLSChameleon(fingerprint=fingerprint, **session_kw) as client:
-        return client.options(url, **request_kw)
+    return _call("options", url, fingerprint, kwargs)
 
 Session = TLSChameleon
 
@@ -986,6 +1588,11 @@ Session = TLSChameleon
 TLSSession = TLSChameleon
 
 
+@functools.lru_cache(maxsize=1)
+def _available_profiles() -> tuple:
+    return tuple(sorted(_PROFILE_NAMES))
+
+
 def list_available_profiles() -> List[str]:
     """
     List all available fingerprint profiles.
@@ -993,8 +1600,5 @@ def list_available_profiles() -> List[str]:
     Returns:
         List of profile names that can be used with TLSSession(profile=...)
     """
-    profiles = list(PROFILES.keys())
-    if HAS_GALLERY:
-        profiles.extend(FINGERPRINT_GALLERY.keys())
-    return sorted(set(profiles))
+    return list(_available_profiles())
 
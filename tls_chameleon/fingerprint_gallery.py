@@ -20,9 +20,9 @@ Each profile includes:
 - Randomization parameters
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import random
-import copy
+import re
 
 
 # =============================================================================
@@ -47,6 +47,36 @@ CHROME_BASE = {
     "ja4": "t13d1516h2_8daaf6152771_bba078b4bd11", # Generic Chrome JA4
 }
 
+# Cipher suites, extension order and header order shared by the Chrome
+# profiles (and the Chromium-based Edge ones). Tuples, so every profile
+# references one immutable object.
+CHROME_CIPHERS = (
+    "TLS_AES_128_GCM_SHA256",
+    "TLS_AES_256_GCM_SHA384",
+    "TLS_CHACHA20_POLY1305_SHA256",
+    "ECDHE-ECDSA-AES128-GCM-SHA256",
+    "ECDHE-RSA-AES128-GCM-SHA256",
+    "ECDHE-ECDSA-AES256-GCM-SHA384",
+    "ECDHE-RSA-AES256-GCM-SHA384",
+    "ECDHE-ECDSA-CHACHA20-POLY1305",
+    "ECDHE-RSA-CHACHA20-POLY1305",
+    "ECDHE-RSA-AES128-SHA",
+    "ECDHE-RSA-AES256-SHA",
+    "AES128-GCM-SHA256",
+    "AES256-GCM-SHA384",
+    "AES128-SHA",
+    "AES256-SHA",
+)
+CHROME_EXTENSIONS = (0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21)
+CHROME_120_HEADER_ORDER = (
+    "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
+    "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
+    "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
+    "accept-encoding", "accept-language",
+)
+# Chrome 124+ also sends the priority header
+CHROME_124_HEADER_ORDER = CHROME_120_HEADER_ORDER + ("priority",)
+
 # Chrome 120 - Windows 11
 CHROME_120_WIN11 = {
     **CHROME_BASE,
@@ -57,138 +87,31 @@ CHROME_120_WIN11 = {
     "sec_ch_ua_platform": '"Windows"',
     "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
     "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language"
-    ],
+    "ciphers": CHROME_CIPHERS,
+    "extensions": CHROME_EXTENSIONS,
+    "header_order": CHROME_120_HEADER_ORDER,
 }
 
 # Chrome 120 - Windows 10
 CHROME_120_WIN10 = {
-    **CHROME_BASE,
+    **CHROME_120_WIN11,
     "name": "chrome_120_win10",
-    "impersonate": "chrome120",
-    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "sec_ch_ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-    "sec_ch_ua_platform": '"Windows"',
-    "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
-    "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language"
-    ],
 }
 
 # Chrome 120 - macOS
 CHROME_120_MACOS = {
-    **CHROME_BASE,
+    **CHROME_120_WIN11,
     "name": "chrome_120_macos",
-    "impersonate": "chrome120",
     "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "sec_ch_ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
     "sec_ch_ua_platform": '"macOS"',
-    "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
-    "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language"
-    ],
 }
 
 # Chrome 120 - Linux
 CHROME_120_LINUX = {
-    **CHROME_BASE,
+    **CHROME_120_WIN11,
     "name": "chrome_120_linux",
-    "impersonate": "chrome120",
     "user_agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "sec_ch_ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
     "sec_ch_ua_platform": '"Linux"',
-    "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
-    "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language"
-    ],
 }
 
 # Chrome 124 - Windows 11
@@ -201,138 +124,31 @@ CHROME_124_WIN11 = {
     "sec_ch_ua_platform": '"Windows"',
     "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
     "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language", "priority"
-    ],
+    "ciphers": CHROME_CIPHERS,
+    "extensions": CHROME_EXTENSIONS,
+    "header_order": CHROME_124_HEADER_ORDER,
 }
 
 # Chrome 124 - Windows 10
 CHROME_124_WIN10 = {
-    **CHROME_BASE,
+    **CHROME_124_WIN11,
     "name": "chrome_124_win10",
-    "impersonate": "chrome124",
-    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-    "sec_ch_ua": '"Chromium";v="124", "Google Chrome";v="124", "Not-A.Brand";v="99"',
-    "sec_ch_ua_platform": '"Windows"',
-    "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
-    "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language", "priority"
-    ],
 }
 
 # Chrome 124 - macOS
 CHROME_124_MACOS = {
-    **CHROME_BASE,
+    **CHROME_124_WIN11,
     "name": "chrome_124_macos",
-    "impersonate": "chrome124",
     "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-    "sec_ch_ua": '"Chromium";v="124", "Google Chrome";v="124", "Not-A.Brand";v="99"',
     "sec_ch_ua_platform": '"macOS"',
-    "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
-    "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language", "priority"
-    ],
 }
 
 # Chrome 124 - Linux
 CHROME_124_LINUX = {
-    **CHROME_BASE,
+    **CHROME_124_WIN11,
     "name": "chrome_124_linux",
-    "impersonate": "chrome124",
     "user_agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-    "sec_ch_ua": '"Chromium";v="124", "Google Chrome";v="124", "Not-A.Brand";v="99"',
     "sec_ch_ua_platform": '"Linux"',
-    "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
-    "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": [
-        "TLS_AES_128_GCM_SHA256",
-        "TLS_AES_256_GCM_SHA384",
-        "TLS_CHACHA20_POLY1305_SHA256",
-        "ECDHE-ECDSA-AES128-GCM-SHA256",
-        "ECDHE-RSA-AES128-GCM-SHA256",
-        "ECDHE-ECDSA-AES256-GCM-SHA384",
-        "ECDHE-RSA-AES256-GCM-SHA384",
-        "ECDHE-ECDSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-CHACHA20-POLY1305",
-        "ECDHE-RSA-AES128-SHA",
-        "ECDHE-RSA-AES256-SHA",
-        "AES128-GCM-SHA256",
-        "AES256-GCM-SHA384",
-        "AES128-SHA",
-        "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 13, 18, 51, 45, 43, 27, 17513, 21],
-    "header_order": [
-        "host", "connection", "cache-control", "sec-ch-ua", "sec-ch-ua-mobile",
-        "sec-ch-ua-platform", "upgrade-insecure-requests", "user-agent", "accept",
-        "sec-fetch-site", "sec-fetch-mode", "sec-fetch-user", "sec-fetch-dest",
-        "accept-encoding", "accept-language", "priority"
-    ],
 }
 
 # Chrome 125 - All platforms
@@ -345,9 +161,9 @@ CHROME_125_WIN11 = {
     "sec_ch_ua_platform": '"Windows"',
     "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
     "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": CHROME_124_WIN11["ciphers"],
-    "extensions": CHROME_124_WIN11["extensions"],
-    "header_order": CHROME_124_WIN11["header_order"],
+    "ciphers": CHROME_CIPHERS,
+    "extensions": CHROME_EXTENSIONS,
+    "header_order": CHROME_124_HEADER_ORDER,
 }
 
 CHROME_125_WIN10 = {**CHROME_125_WIN11, "name": "chrome_125_win10"}
@@ -394,7 +210,7 @@ FIREFOX_120_WIN11 = {
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
     "ja3": "771,4865-4867-4866-49195-49199-52393-52392-49196-49200-49162-49161-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-34-51-43-13-45-28-21,29-23-24-25-256-257,0",
     "ja3_hash": "579ccef312e5ce0e367e8d1a9a11add4",
-    "ciphers": [
+    "ciphers": (
         "TLS_AES_128_GCM_SHA256",
         "TLS_CHACHA20_POLY1305_SHA256",
         "TLS_AES_256_GCM_SHA384",
@@ -412,13 +228,13 @@ FIREFOX_120_WIN11 = {
         "AES256-GCM-SHA384",
         "AES128-SHA",
         "AES256-SHA",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 35, 16, 5, 34, 51, 43, 13, 45, 28, 21],
-    "header_order": [
+    ),
+    "extensions": (0, 23, 65281, 10, 11, 35, 16, 5, 34, 51, 43, 13, 45, 28, 21),
+    "header_order": (
         "Host", "User-Agent", "Accept", "Accept-Language", "Accept-Encoding",
         "Connection", "Upgrade-Insecure-Requests", "Sec-Fetch-Dest", 
-        "Sec-Fetch-Mode", "Sec-Fetch-Site", "Sec-Fetch-User"
-    ],
+        "Sec-Fetch-Mode", "Sec-Fetch-Site", "Sec-Fetch-User",
+    ),
 }
 
 FIREFOX_120_WIN10 = {
@@ -493,7 +309,7 @@ SAFARI_IOS17 = {
     "user_agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1",
     "ja3": "771,4865-4866-4867-49196-49195-52393-49200-49199-52392-49188-49187-49162-49161-49172-49171-157-156-53-47-255,0-23-65281-10-11-16-5-13-18-51-45-43-27-21,29-23-24-25,0",
     "ja3_hash": "773906b0efdefa24a7f2b8eb6985bf37",
-    "ciphers": [
+    "ciphers": (
         "TLS_AES_128_GCM_SHA256",
         "TLS_AES_256_GCM_SHA384",
         "TLS_CHACHA20_POLY1305_SHA256",
@@ -503,12 +319,12 @@ SAFARI_IOS17 = {
         "ECDHE-RSA-AES256-GCM-SHA384",
         "ECDHE-RSA-AES128-GCM-SHA256",
         "ECDHE-RSA-CHACHA20-POLY1305",
-    ],
-    "extensions": [0, 23, 65281, 10, 11, 16, 5, 13, 18, 51, 45, 43, 27, 21],
-    "header_order": [
+    ),
+    "extensions": (0, 23, 65281, 10, 11, 16, 5, 13, 18, 51, 45, 43, 27, 21),
+    "header_order": (
         "Host", "Accept", "Accept-Language", "User-Agent", 
-        "Accept-Encoding", "Connection"
-    ],
+        "Accept-Encoding", "Connection",
+    ),
 }
 
 # Safari iOS 16
@@ -568,9 +384,9 @@ EDGE_120_WIN11 = {
     "sec_ch_ua_platform": '"Windows"',
     "ja3": "771,4865-4866-4867-49195-49199-49196-49200-52393-52392-49171-49172-156-157-47-53,0-23-65281-10-11-35-16-5-13-18-51-45-43-27-17513-21,29-23-24,0",
     "ja3_hash": "cd08e31494f9531f560d64c695473da9",
-    "ciphers": CHROME_120_WIN11["ciphers"],
-    "extensions": CHROME_120_WIN11["extensions"],
-    "header_order": CHROME_120_WIN11["header_order"],
+    "ciphers": CHROME_CIPHERS,
+    "extensions": CHROME_EXTENSIONS,
+    "header_order": CHROME_120_HEADER_ORDER,
 }
 
 # Edge 120 - Windows 10
@@ -589,9 +405,9 @@ EDGE_124_WIN11 = {
     "sec_ch_ua_platform": '"Windows"',
     "ja3": EDGE_120_WIN11["ja3"],
     "ja3_hash": EDGE_120_WIN11["ja3_hash"],
-    "ciphers": CHROME_124_WIN11["ciphers"],
-    "extensions": CHROME_124_WIN11["extensions"],
-    "header_order": CHROME_124_WIN11["header_order"],
+    "ciphers": CHROME_CIPHERS,
+    "extensions": CHROME_EXTENSIONS,
+    "header_order": CHROME_124_HEADER_ORDER,
 }
 
 # Edge 124 - Windows 10
@@ -614,9 +430,9 @@ CHROME_ANDROID_120 = {
     "sec_ch_ua_mobile": "?1",
     "ja3": CHROME_120_WIN11["ja3"],
     "ja3_hash": CHROME_120_WIN11["ja3_hash"],
-    "ciphers": CHROME_120_WIN11["ciphers"],
-    "extensions": CHROME_120_WIN11["extensions"],
-    "header_order": CHROME_120_WIN11["header_order"],
+    "ciphers": CHROME_CIPHERS,
+    "extensions": CHROME_EXTENSIONS,
+    "header_order": CHROME_120_HEADER_ORDER,
 }
 
 CHROME_ANDROID_124 = {
@@ -712,6 +528,38 @@ FINGERPRINT_GALLERY["mobile_safari_17"] = SAFARI_IOS17
 FINGERPRINT_GALLERY["ios_safari_17"] = SAFARI_IOS17
 
 
+
+# =============================================================================
+# LOOKUP INDEXES
+# =============================================================================
+
+# OS tokens documented for get_profiles_by_os()
+KNOWN_OS_NAMES = ("win11", "win10", "macos", "linux", "ios", "android")
+
+
+def _build_indexes() -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
+    """
+    Build browser -> names and OS -> names indexes in one pass over the gallery.
+    
+    Browser keys are the leading name token ("chrome" for "chrome_120_win11"),
+    OS keys follow the substring semantics of get_profiles_by_os().
+    """
+    by_browser: Dict[str, List[str]] = {}
+    by_os: Dict[str, List[str]] = {os_name: [] for os_name in KNOWN_OS_NAMES}
+    for name in FINGERPRINT_GALLERY:
+        by_browser.setdefault(name.split("_", 1)[0], []).append(name)
+        for os_name in KNOWN_OS_NAMES:
+            if os_name in name:
+                by_os[os_name].append(name)
+    return (
+        {k: tuple(v) for k, v in by_browser.items()},
+        {k: tuple(v) for k, v in by_os.items()},
+    )
+
+
+_BY_BROWSER, _BY_OS = _build_indexes()
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -726,29 +574,48 @@ def get_all_profiles() -> List[str]:
     return list(FINGERPRINT_GALLERY.keys())
 
 
+def _names_by_browser(browser: str) -> Sequence[str]:
+    """Profile names starting with the lowercased `browser`, in gallery order."""
+    names = _BY_BROWSER.get(browser)
+    if names is None:
+        # Not a plain browser token (e.g. "chrome_12"), fall back to a prefix scan.
+        # A prefix containing "_" can only match inside its leading token's bucket.
+        head, sep, _ = browser.partition("_")
+        candidates = _BY_BROWSER.get(head, ()) if sep else FINGERPRINT_GALLERY
+        names = [name for name in candidates if name.startswith(browser)]
+    return names
+
+
+def _names_by_os(os_name: str) -> Sequence[str]:
+    """Profile names containing the lowercased `os_name`, in gallery order."""
+    names = _BY_OS.get(os_name)
+    if names is None:
+        names = [name for name in FINGERPRINT_GALLERY.keys() if os_name in name]
+    return names
+
+
 def get_profiles_by_browser(browser: str) -> List[str]:
     """Get all profiles for a specific browser (chrome, firefox, safari, edge)."""
-    browser = browser.lower()
-    return [name for name in FINGERPRINT_GALLERY.keys() if name.startswith(browser)]
+    return list(_names_by_browser(browser.lower()))
 
 
 def get_profiles_by_os(os_name: str) -> List[str]:
     """Get all profiles for a specific OS (win11, win10, macos, linux, ios, android)."""
-    os_name = os_name.lower()
-    return [name for name in FINGERPRINT_GALLERY.keys() if os_name in name]
+    return list(_names_by_os(os_name.lower()))
 
 
 def get_random_profile(browser: Optional[str] = None, os_name: Optional[str] = None) -> Dict[str, Any]:
     """Get a random profile, optionally filtered by browser and/or OS."""
-    candidates = list(FINGERPRINT_GALLERY.keys())
-    
     if browser:
-        browser = browser.lower()
-        candidates = [n for n in candidates if n.startswith(browser)]
-    
-    if os_name:
-        os_name = os_name.lower()
-        candidates = [n for n in candidates if os_name in n]
+        candidates = _names_by_browser(browser.lower())
+        if os_name:
+            # The browser bucket is small, filter it rather than intersecting
+            os_name = os_name.lower()
+            candidates = [n for n in candidates if os_name in n]
+    elif os_name:
+        candidates = _names_by_os(os_name.lower())
+    else:
+        candidates = list(FINGERPRINT_GALLERY.keys())
     
     if not candidates:
         # Fall back to default
@@ -757,6 +624,44 @@ def get_random_profile(browser: Optional[str] = None, os_name: Optional[str] = N
     return FINGERPRINT_GALLERY[random.choice(candidates)]
 
 
+def _copy_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a profile so the result can be mutated freely.
+    
+    Profiles are one level deep (dicts of scalars, sequences of scalars),
+    so copying the mutable containers is a deepcopy without its overhead.
+    """
+    return {
+        k: dict(v) if isinstance(v, dict) else list(v) if isinstance(v, list) else v
+        for k, v in profile.items()
+    }
+
+
+# Last component of the browser's own version token (Chrome/120.0.0.0 -> 0),
+# never the "Mozilla/5.0" prefix
+_UA_VERSION_RE = re.compile(r'((?:Chrome|Firefox|Edg|Version)/[\d.]*\.)(\d+)')
+# Vary by -1 to +2, weighted towards small bumps
+_UA_PATCH_DELTAS = (-1, 0, 0, 1, 1, 2)
+
+
+def _bump_version(m: "re.Match") -> str:
+    new_ver = max(0, int(m.group(2)) + random.choice(_UA_PATCH_DELTAS))
+    return f"{m.group(1)}{new_ver}"
+
+
+def _perturb_order(items: Sequence[Any], variance: int, rng: Optional[random.Random] = None) -> List[Any]:
+    """Shuffle one random window of ``variance + 1`` neighbours in a copy of items."""
+    out = list(items)
+    k = min(variance, len(out) - 1)
+    if k > 0:
+        rng = rng or random
+        start = rng.randint(0, len(out) - 1 - k)
+        window = out[start:start + k + 1]
+        rng.shuffle(window)
+        out[start:start + k + 1] = window
+    return out
+
+
 def randomize_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a randomized variant of a profile.
@@ -764,29 +669,19 @@ def randomize_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
     This creates slight variations that still look like the same browser
     but differ enough to avoid pattern detection.
     """
-    variant = copy.deepcopy(profile)
+    variant = _copy_profile(profile)
     randomization = variant.get("randomization", {})
     
     # Minor User-Agent version variance
     if randomization.get("ua_minor_variance"):
         ua = variant.get("user_agent", "")
         # Randomly tweak patch version (last number)
-        import re
-        def bump_version(m):
-            base = int(m.group(1))
-            # Vary by -1 to +2
-            new_ver = max(0, base + random.choice([-1, 0, 0, 1, 1, 2]))
-            return f".{new_ver}"
-        variant["user_agent"] = re.sub(r'\.(\d+)(?=\s|$)', bump_version, ua, count=1)
+        variant["user_agent"] = _UA_VERSION_RE.sub(_bump_version, ua, count=1)
     
     # Extension order variance (Firefox mainly)
     ext_variance = randomization.get("extension_variance", 0)
     if ext_variance > 0 and "extensions" in variant:
-        exts = list(variant["extensions"])
-        # Swap a few adjacent extensions
-        for _ in range(min(ext_variance, len(exts) - 1)):
-            i = random.randint(0, len(exts) - 2)
-            exts[i], exts[i + 1] = exts[i + 1], exts[i]
-        variant["extensions"] = exts
+        # Reorder a few neighbouring extensions
+        variant["extensions"] = _perturb_order(variant["extensions"], ext_variance)
     
     return variant
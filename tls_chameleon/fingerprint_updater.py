@@ -17,13 +17,21 @@ will always work without network access.
 import json
 import os
 import time
-from typing import Dict, Any, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 
 # Cache configuration
 DEFAULT_CACHE_DIR = Path.home() / ".tls_chameleon" / "cache"
 CACHE_TTL_SECONDS = 86400 * 7  # 1 week
+# Set to 1 to have every FingerprintUpdater prewarm its sources by default
+PREWARM_ENV_VAR = "TLS_CHAMELEON_PREWARM"
 
 
 # Public fingerprint data sources
@@ -43,16 +51,32 @@ class FingerprintUpdater:
     with bundled fingerprints.
     """
     
-    def __init__(self, cache_dir: Optional[Path] = None):
+    def __init__(self, cache_dir: Optional[Path] = None, prewarm: Optional[bool] = None):
         """
         Initialize the updater.
         
         Args:
             cache_dir: Directory for caching downloaded fingerprints
+            prewarm: Start loading every source in the background right away
+                (see prewarm()). Defaults to the TLS_CHAMELEON_PREWARM
+                environment variable.
         """
         self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
         self._ensure_cache_dir()
         self._http_client = None
+        # Parsed cache files by source: (fetched-at time, payload). A gallery
+        # update asks for the same source once per profile.
+        self._loaded: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._prewarm_futures: Dict[str, Future] = {}
+        # JA3 lookups by lowered browser token, valid for the ja3er payload
+        # they were computed from
+        self._ja3_source: Optional[Dict[str, Any]] = None
+        self._ja3_index: Dict[str, Optional[str]] = {}
+        
+        if prewarm is None:
+            prewarm = os.environ.get(PREWARM_ENV_VAR) == "1"
+        if prewarm:
+            self.prewarm()
     
     def _ensure_cache_dir(self):
         """Create cache directory if it doesn't exist."""
@@ -66,7 +90,18 @@ class FingerprintUpdater:
         if self._http_client is None:
             try:
                 import httpx
-                self._http_client = httpx.Client(timeout=30.0)
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                # The sources are a few large downloads from separate hosts:
+                # give up quickly on a host that doesn't answer, but let a
+                # slow transfer run its course
+                self._http_client = httpx.Client(
+                    http2=http2,
+                    timeout=httpx.Timeout(30.0, connect=5.0),
+                )
             except ImportError:
                 # Try requests as fallback
                 try:
@@ -80,38 +115,69 @@ class FingerprintUpdater:
         """Get the cache file path for a source."""
         return self.cache_dir / f"{source_name}.json"
     
+    def _load_cache(self, source_name: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Cached (fetched-at time, payload) for a source, read from disk once."""
+        entry = self._loaded.get(source_name)
+        if entry is None:
+            cache_path = self._get_cache_path(source_name)
+            try:
+                mtime = cache_path.stat().st_mtime
+                raw = cache_path.read_bytes()
+                payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, OSError):
+                return None
+            entry = self._loaded[source_name] = (mtime, payload)
+        return entry
+    
     def _is_cache_valid(self, source_name: str) -> bool:
         """Check if cached data is still valid (not expired)."""
-        cache_path = self._get_cache_path(source_name)
-        if not cache_path.exists():
-            return False
-        
-        # Check age
-        mtime = cache_path.stat().st_mtime
-        age = time.time() - mtime
-        return age < CACHE_TTL_SECONDS
+        entry = self._load_cache(source_name)
+        return entry is not None and time.time() - entry[0] < CACHE_TTL_SECONDS
     
     def _read_cache(self, source_name: str) -> Optional[Dict[str, Any]]:
         """Read cached fingerprint data."""
-        cache_path = self._get_cache_path(source_name)
-        if not cache_path.exists():
-            return None
-        
-        try:
-            with open(cache_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return None
+        entry = self._load_cache(source_name)
+        return entry[1] if entry else None
     
     def _write_cache(self, source_name: str, data: Dict[str, Any]):
         """Write fingerprint data to cache."""
+        self._loaded[source_name] = (time.time(), data)
         cache_path = self._get_cache_path(source_name)
         try:
-            with open(cache_path, "w") as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                cache_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(cache_path, "w") as f:
+                    json.dump(data, f, indent=2)
+        except (TypeError, ValueError, OSError):
+            pass
+    
+    def _touch_cache(self, source_name: str, data: Dict[str, Any]):
+        """Mark cached data as fresh again (the source reported it unchanged)."""
+        self._loaded[source_name] = (time.time(), data)
+        try:
+            os.utime(self._get_cache_path(source_name))
         except OSError:
             pass
     
+    def prewarm(self) -> None:
+        """
+        Load (or download) every source in the background.
+        
+        Returns immediately; fetch_fingerprints() for a source that is still
+        loading waits for that load instead of starting its own.
+        """
+        # Create the shared client up front so the workers don't race to do it
+        self._get_http_client()
+        pool = ThreadPoolExecutor(
+            max_workers=len(FINGERPRINT_SOURCES), thread_name_prefix="chameleon-prewarm"
+        )
+        for source in FINGERPRINT_SOURCES:
+            if source not in self._prewarm_futures:
+                self._prewarm_futures[source] = pool.submit(self._fetch_fingerprints, source)
+        # Workers finish their fetch and exit; nothing else is queued
+        pool.shutdown(wait=False)
+    
     def fetch_fingerprints(
         self, 
         source: str = "ja3er",
@@ -127,6 +193,18 @@ class FingerprintUpdater:
         Returns:
             Dict of fingerprint data or None if unavailable
         """
+        pending = self._prewarm_futures.pop(source, None)
+        if pending is not None:
+            # Let the background load finish; it fills the cache used below
+            try:
+                pending.result()
+            except Exception:
+                pass
+        return self._fetch_fingerprints(source, force_refresh)
+    
+    def _fetch_fingerprints(
+        self, source: str, force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
         # Check cache first
         if not force_refresh and self._is_cache_valid(source):
             cached = self._read_cache(source)
@@ -144,23 +222,34 @@ class FingerprintUpdater:
         if not url:
             return None
         
+        # Revalidate an expired copy instead of downloading it again
+        cached = None if force_refresh else self._read_cache(source)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
         try:
-            # Fetch data
-            if hasattr(client, "get"):
-                response = client.get(url)
-                if hasattr(response, "json"):
-                    data = response.json()
-                else:
-                    data = response.json()
-            else:
-                # httpx client
-                response = client.get(url)
-                data = response.json()
+            # Fetch data (httpx client or the requests module)
+            response = client.get(url, headers=headers)
+            if cached and response.status_code == 304:
+                self._touch_cache(source, cached)
+                return cached
+            data = response.json()
             
-            # Cache the result
-            self._write_cache(source, {"data": data, "timestamp": time.time()})
+            # Cache the result, with validators for the next revalidation
+            result = {"data": data, "timestamp": time.time()}
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag:
+                result["etag"] = etag
+            if last_modified:
+                result["last_modified"] = last_modified
+            self._write_cache(source, result)
             
-            return {"data": data, "timestamp": time.time()}
+            return result
             
         except Exception:
             # Fetch failed, return cached data even if expired
@@ -180,17 +269,26 @@ class FingerprintUpdater:
         if not data or "data" not in data:
             return None
         
-        # Search for matching browser in fingerprint data
+        if data is not self._ja3_source:
+            self._ja3_source = data
+            self._ja3_index = {}
+        
         browser_lower = browser.lower()
-        fingerprints = data.get("data", [])
+        if browser_lower in self._ja3_index:
+            return self._ja3_index[browser_lower]
         
+        # Search for matching browser in fingerprint data
+        ja3 = None
+        fingerprints = data.get("data", [])
         if isinstance(fingerprints, list):
             for fp in fingerprints:
                 user_agent = fp.get("User-Agent", "").lower()
                 if browser_lower in user_agent:
-                    return fp.get("JA3 Hash") or fp.get("ja3_hash")
+                    ja3 = fp.get("JA3 Hash") or fp.get("ja3_hash")
+                    break
         
-        return None
+        self._ja3_index[browser_lower] = ja3
+        return ja3
     
     def update_profile(
         self, 
@@ -207,8 +305,8 @@ class FingerprintUpdater:
         Returns:
             Updated profile dict
         """
-        import copy
-        updated = copy.deepcopy(profile)
+        from .fingerprint_gallery import _copy_profile
+        updated = _copy_profile(profile)
         
         # Try to get latest JA3 for this browser type
         browser = profile_name.split("_")[0]  # e.g., "chrome" from "chrome_120_win11"
@@ -231,14 +329,22 @@ class FingerprintUpdater:
         updated_count = 0
         for name, profile in FINGERPRINT_GALLERY.items():
             try:
-                new_profile = self.update_profile(name, profile)
-                if new_profile.get("ja3_hash") != profile.get("ja3_hash"):
+                # Same lookup as update_profile(), without copying each
+                # profile just to compare one field
+                latest_ja3 = self.get_latest_ja3(name.partition("_")[0])
+                if latest_ja3 and latest_ja3 != profile.get("ja3_hash"):
                     # Update in-place
-                    profile["ja3_hash"] = new_profile["ja3_hash"]
+                    profile["ja3_hash"] = latest_ja3
                     updated_count += 1
             except Exception:
                 continue
         
+        if updated_count:
+            # Drop memoized profile lookups so clients see the new hashes
+            from .client import _get_profile, _static_cipher_list
+            _get_profile.cache_clear()
+            _static_cipher_list.cache_clear()
+        
         return updated_count
     
     def get_cache_info(self) -> Dict[str, Any]:
@@ -253,11 +359,26 @@ class FingerprintUpdater:
             "sources": {}
         }
         
+        # One directory pass; only the source files present get stat()ed
+        wanted = {self._get_cache_path(name).name: name for name in FINGERPRINT_SOURCES}
+        mtimes = {}
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    source_name = wanted.get(entry.name)
+                    if source_name is not None:
+                        try:
+                            mtimes[source_name] = entry.stat().st_mtime
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+        
+        now = time.time()
         for source_name in FINGERPRINT_SOURCES:
-            cache_path = self._get_cache_path(source_name)
-            if cache_path.exists():
-                mtime = cache_path.stat().st_mtime
-                age = time.time() - mtime
+            mtime = mtimes.get(source_name)
+            if mtime is not None:
+                age = now - mtime
                 info["sources"][source_name] = {
                     "cached": True,
                     "age_seconds": int(age),
@@ -274,6 +395,9 @@ class FingerprintUpdater:
     
     def clear_cache(self):
         """Clear all cached fingerprint data."""
+        self._loaded.clear()
+        self._ja3_source = None
+        self._ja3_index = {}
         for source_name in FINGERPRINT_SOURCES:
             cache_path = self._get_cache_path(source_name)
             try:
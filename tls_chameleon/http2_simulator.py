@@ -10,7 +10,15 @@ Different browsers send different HTTP/2 SETTINGS frames:
 - Safari: Minimal settings, simple priorities
 """
 
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+
+@lru_cache(maxsize=128)
+def _browser_key(browser: str) -> str:
+    """Table key for a browser or profile name ("chrome_124_win11" -> "chrome")."""
+    return browser.lower().partition("_")[0]
 
 
 # HTTP/2 SETTINGS Frame IDs
@@ -25,35 +33,39 @@ SETTINGS_MAX_HEADER_LIST_SIZE = 6
 class HTTP2Profile:
     """Browser-specific HTTP/2 configuration profiles."""
     
+    # The per-browser tables are read-only views handed out as-is, so no
+    # caller can alter them for the rest of the process. The BROWSER_*
+    # registries stay plain dicts so further browsers can be added.
+    
     # Chrome HTTP/2 Settings
-    CHROME_SETTINGS = {
+    CHROME_SETTINGS = MappingProxyType({
         SETTINGS_HEADER_TABLE_SIZE: 65536,
         SETTINGS_ENABLE_PUSH: 0,
         SETTINGS_MAX_CONCURRENT_STREAMS: 1000,
         SETTINGS_INITIAL_WINDOW_SIZE: 6291456,
         SETTINGS_MAX_FRAME_SIZE: 16384,
         SETTINGS_MAX_HEADER_LIST_SIZE: 262144,
-    }
+    })
     
     # Firefox HTTP/2 Settings
-    FIREFOX_SETTINGS = {
+    FIREFOX_SETTINGS = MappingProxyType({
         SETTINGS_HEADER_TABLE_SIZE: 65536,
         SETTINGS_ENABLE_PUSH: 1,
         SETTINGS_MAX_CONCURRENT_STREAMS: 100,
         SETTINGS_INITIAL_WINDOW_SIZE: 131072,
         SETTINGS_MAX_FRAME_SIZE: 16384,
         SETTINGS_MAX_HEADER_LIST_SIZE: 65536,
-    }
+    })
     
     # Safari HTTP/2 Settings
-    SAFARI_SETTINGS = {
+    SAFARI_SETTINGS = MappingProxyType({
         SETTINGS_HEADER_TABLE_SIZE: 4096,
         SETTINGS_ENABLE_PUSH: 0,
         SETTINGS_MAX_CONCURRENT_STREAMS: 100,
         SETTINGS_INITIAL_WINDOW_SIZE: 65535,
         SETTINGS_MAX_FRAME_SIZE: 16384,
         SETTINGS_MAX_HEADER_LIST_SIZE: 16384,
-    }
+    })
     
     # Edge HTTP/2 Settings (same as Chrome, Chromium-based)
     EDGE_SETTINGS = CHROME_SETTINGS
@@ -68,32 +80,32 @@ class HTTP2Profile:
     
     # HTTP/2 Priority patterns (stream weight and dependencies)
     # These represent the initial priority tree structure
-    CHROME_PRIORITY = {
-        "html": {"weight": 256, "exclusive": True, "depends_on": 0},
-        "css": {"weight": 256, "exclusive": False, "depends_on": 0},
-        "js": {"weight": 220, "exclusive": False, "depends_on": 0},
-        "image": {"weight": 110, "exclusive": False, "depends_on": 0},
-        "font": {"weight": 183, "exclusive": False, "depends_on": 0},
-    }
-    
-    FIREFOX_PRIORITY = {
+    CHROME_PRIORITY = MappingProxyType({
+        "html": MappingProxyType({"weight": 256, "exclusive": True, "depends_on": 0}),
+        "css": MappingProxyType({"weight": 256, "exclusive": False, "depends_on": 0}),
+        "js": MappingProxyType({"weight": 220, "exclusive": False, "depends_on": 0}),
+        "image": MappingProxyType({"weight": 110, "exclusive": False, "depends_on": 0}),
+        "font": MappingProxyType({"weight": 183, "exclusive": False, "depends_on": 0}),
+    })
+    
+    FIREFOX_PRIORITY = MappingProxyType({
         # Firefox uses a more complex priority tree
-        "leader": {"weight": 201, "exclusive": False, "depends_on": 0},
-        "html": {"weight": 32, "exclusive": False, "depends_on": "leader"},
-        "css": {"weight": 32, "exclusive": False, "depends_on": "leader"},
-        "js": {"weight": 32, "exclusive": False, "depends_on": "leader"},
-        "image": {"weight": 22, "exclusive": False, "depends_on": "leader"},
-        "font": {"weight": 32, "exclusive": False, "depends_on": "leader"},
-    }
-    
-    SAFARI_PRIORITY = {
+        "leader": MappingProxyType({"weight": 201, "exclusive": False, "depends_on": 0}),
+        "html": MappingProxyType({"weight": 32, "exclusive": False, "depends_on": "leader"}),
+        "css": MappingProxyType({"weight": 32, "exclusive": False, "depends_on": "leader"}),
+        "js": MappingProxyType({"weight": 32, "exclusive": False, "depends_on": "leader"}),
+        "image": MappingProxyType({"weight": 22, "exclusive": False, "depends_on": "leader"}),
+        "font": MappingProxyType({"weight": 32, "exclusive": False, "depends_on": "leader"}),
+    })
+    
+    SAFARI_PRIORITY = MappingProxyType({
         # Safari uses simpler priorities
-        "html": {"weight": 255, "exclusive": False, "depends_on": 0},
-        "css": {"weight": 255, "exclusive": False, "depends_on": 0},
-        "js": {"weight": 255, "exclusive": False, "depends_on": 0},
-        "image": {"weight": 255, "exclusive": False, "depends_on": 0},
-        "font": {"weight": 255, "exclusive": False, "depends_on": 0},
-    }
+        "html": MappingProxyType({"weight": 255, "exclusive": False, "depends_on": 0}),
+        "css": MappingProxyType({"weight": 255, "exclusive": False, "depends_on": 0}),
+        "js": MappingProxyType({"weight": 255, "exclusive": False, "depends_on": 0}),
+        "image": MappingProxyType({"weight": 255, "exclusive": False, "depends_on": 0}),
+        "font": MappingProxyType({"weight": 255, "exclusive": False, "depends_on": 0}),
+    })
     
     BROWSER_PRIORITY = {
         "chrome": CHROME_PRIORITY,
@@ -103,20 +115,20 @@ class HTTP2Profile:
     }
     
     # Window update patterns (when browsers send WINDOW_UPDATE frames)
-    CHROME_WINDOW_UPDATE = {
+    CHROME_WINDOW_UPDATE = MappingProxyType({
         "threshold": 0.5,  # Send when 50% consumed
         "increment": 15728640,  # 15MB increment
-    }
+    })
     
-    FIREFOX_WINDOW_UPDATE = {
+    FIREFOX_WINDOW_UPDATE = MappingProxyType({
         "threshold": 0.75,  # Send when 75% consumed
         "increment": 65536,  # 64KB increment
-    }
+    })
     
-    SAFARI_WINDOW_UPDATE = {
+    SAFARI_WINDOW_UPDATE = MappingProxyType({
         "threshold": 0.5,
         "increment": 65535,
-    }
+    })
     
     BROWSER_WINDOW_UPDATE = {
         "chrome": CHROME_WINDOW_UPDATE,
@@ -125,8 +137,18 @@ class HTTP2Profile:
         "edge": CHROME_WINDOW_UPDATE,
     }
     
+    # Frame order in the connection preface
+    CHROME_PREFACE_ORDER = ("SETTINGS", "WINDOW_UPDATE", "PRIORITY")
+    
+    BROWSER_PREFACE_ORDER = {
+        "chrome": CHROME_PREFACE_ORDER,
+        "firefox": ("SETTINGS", "PRIORITY", "WINDOW_UPDATE"),
+        "safari": ("SETTINGS", "WINDOW_UPDATE"),
+        "edge": CHROME_PREFACE_ORDER,
+    }
+    
     @classmethod
-    def get_settings(cls, browser: str) -> Dict[int, int]:
+    def get_settings(cls, browser: str) -> Mapping[int, int]:
         """
         Get HTTP/2 SETTINGS frame values for a browser.
         
@@ -134,13 +156,12 @@ class HTTP2Profile:
             browser: Browser name (chrome, firefox, safari, edge)
             
         Returns:
-            Dict mapping SETTINGS ID to value
+            Read-only mapping of SETTINGS ID to value
         """
-        browser = browser.lower().split("_")[0]  # Handle "chrome_120" -> "chrome"
-        return cls.BROWSER_SETTINGS.get(browser, cls.CHROME_SETTINGS)
+        return cls.BROWSER_SETTINGS.get(_browser_key(browser), cls.CHROME_SETTINGS)
     
     @classmethod
-    def get_priority_pattern(cls, browser: str) -> Dict[str, Dict[str, Any]]:
+    def get_priority_pattern(cls, browser: str) -> Mapping[str, Mapping[str, Any]]:
         """
         Get HTTP/2 stream priority pattern for a browser.
         
@@ -148,13 +169,12 @@ class HTTP2Profile:
             browser: Browser name
             
         Returns:
-            Dict mapping resource type to priority info
+            Read-only mapping of resource type to priority info
         """
-        browser = browser.lower().split("_")[0]
-        return cls.BROWSER_PRIORITY.get(browser, cls.CHROME_PRIORITY)
+        return cls.BROWSER_PRIORITY.get(_browser_key(browser), cls.CHROME_PRIORITY)
     
     @classmethod
-    def get_window_update_pattern(cls, browser: str) -> Dict[str, Any]:
+    def get_window_update_pattern(cls, browser: str) -> Mapping[str, Any]:
         """
         Get HTTP/2 WINDOW_UPDATE behavior for a browser.
         
@@ -162,13 +182,12 @@ class HTTP2Profile:
             browser: Browser name
             
         Returns:
-            Dict with threshold and increment values
+            Read-only mapping with threshold and increment values
         """
-        browser = browser.lower().split("_")[0]
-        return cls.BROWSER_WINDOW_UPDATE.get(browser, cls.CHROME_WINDOW_UPDATE)
+        return cls.BROWSER_WINDOW_UPDATE.get(_browser_key(browser), cls.CHROME_WINDOW_UPDATE)
     
     @classmethod
-    def get_connection_preface_order(cls, browser: str) -> List[str]:
+    def get_connection_preface_order(cls, browser: str) -> Tuple[str, ...]:
         """
         Get the order of frames in the HTTP/2 connection preface.
         
@@ -176,21 +195,12 @@ class HTTP2Profile:
             browser: Browser name
             
         Returns:
-            List of frame types in order
+            Tuple of frame types in order
         """
-        browser = browser.lower().split("_")[0]
-        
-        if browser == "chrome":
-            return ["SETTINGS", "WINDOW_UPDATE", "PRIORITY"]
-        elif browser == "firefox":
-            return ["SETTINGS", "PRIORITY", "WINDOW_UPDATE"]
-        elif browser == "safari":
-            return ["SETTINGS", "WINDOW_UPDATE"]
-        else:
-            return ["SETTINGS", "WINDOW_UPDATE", "PRIORITY"]
+        return cls.BROWSER_PREFACE_ORDER.get(_browser_key(browser), cls.CHROME_PREFACE_ORDER)
     
     @classmethod
-    def format_settings_for_curl(cls, settings: Dict[int, int]) -> str:
+    def format_settings_for_curl(cls, settings: Mapping[int, int]) -> str:
         """
         Format HTTP/2 settings for curl command line.
         
@@ -202,19 +212,25 @@ class HTTP2Profile:
         return f"INITIAL_WINDOW_SIZE={settings.get(SETTINGS_INITIAL_WINDOW_SIZE, 65535)}"
 
 
-def get_http2_profile(browser: str) -> Dict[str, Any]:
+@lru_cache(maxsize=128)
+def get_http2_profile(browser: str) -> Mapping[str, Any]:
     """
     Get complete HTTP/2 profile for a browser.
     
+    Profiles are built once per browser name and shared, so the result is
+    read-only. After adding a browser to the HTTP2Profile registries at
+    runtime, call ``get_http2_profile.cache_clear()``.
+    
     Args:
         browser: Browser name (e.g., "chrome", "firefox", "chrome_124_win11")
         
     Returns:
-        Dict with settings, priority, window_update, and preface_order
+        Read-only mapping with settings, priority, window_update, and preface_order
     """
-    return {
-        "settings": HTTP2Profile.get_settings(browser),
-        "priority": HTTP2Profile.get_priority_pattern(browser),
-        "window_update": HTTP2Profile.get_window_update_pattern(browser),
-        "preface_order": HTTP2Profile.get_connection_preface_order(browser),
-    }
+    key = _browser_key(browser)
+    return MappingProxyType({
+        "settings": HTTP2Profile.BROWSER_SETTINGS.get(key, HTTP2Profile.CHROME_SETTINGS),
+        "priority": HTTP2Profile.BROWSER_PRIORITY.get(key, HTTP2Profile.CHROME_PRIORITY),
+        "window_update": HTTP2Profile.BROWSER_WINDOW_UPDATE.get(key, HTTP2Profile.CHROME_WINDOW_UPDATE),
+        "preface_order": HTTP2Profile.BROWSER_PREFACE_ORDER.get(key, HTTP2Profile.CHROME_PREFACE_ORDER),
+    })
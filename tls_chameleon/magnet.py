@@ -1,25 +1,159 @@
 import re
 import json
-from typing import List, Dict, Any, Optional
+import string
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# Patterns used on every response, compiled once at import
+# Email = local part + "@" + domain; see _iter_emails
+_EMAIL_LOCAL_CHARS = string.ascii_letters + string.digits + "._%+-"
+_EMAIL_DOMAIN_RE = re.compile(r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_HREF_RE = re.compile(r'href=["\'](.*?)["\']')
+_JSONLD_RE = re.compile(r'<script type="application/ld\+json">(.*?)</script>', re.DOTALL)
+_JWT_RE = re.compile(r'ey[a-zA-Z0-9_-]{10,}\.ey[a-zA-Z0-9_-]{10,}\.[a-zA-Z0-9_-]{10,}')
+# A quoted Google key is always found by the bare pattern too (quotes can't
+# occur inside a key), so it needs no pass of its own
+_API_KEY_RES = (
+    re.compile(r'(?:key|api|token|secret|auth|cid|sid)["\']?\s*[:=]\s*["\']([a-zA-Z0-9\-_]{20,})["\']'), # Generic in JSON/Key-Value
+    re.compile(r'AIza[0-9A-Za-z\\-_]{35}'), # Google API Key
+)
+_HIDDEN_INPUT_RE = re.compile(r'<input[^>]*type=["\']hidden["\'][^>]*>', re.IGNORECASE)
+# Quoted name="value" / name='value' attributes, names matched whole so
+# data-name="..." is never read as name="..."
+_ATTR_RE = re.compile(r'([A-Za-z_:][-\w:.]*)=(?:"([^"]*)"|\'([^\']*)\')')
+_CONFIG_RE = re.compile(r'(?:var|const|let)\s+(?:\w+Config|config|appData|initialState)\s*=\s*({.*?});', re.DOTALL)
+_JS_COMMENT_RE = re.compile(r'//.*?\n')
+_TD_RE = re.compile(r'<t[dh][^>]*>(.*?)</t[dh]>', re.DOTALL)
+_FORM_TAG_RE = re.compile(r'<form', re.IGNORECASE)
+# Lowercases A-Z only, so every index stays valid in the original text
+_ASCII_LOWER = {c: c + 32 for c in range(ord("A"), ord("Z") + 1)}
+
+
+def _iter_emails(text: str) -> Iterator[str]:
+    """
+    All matches of ``[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}``, in order.
+    
+    Starts from each '@' and takes the local part as the run of local-part
+    characters before it. As one regex, the engine retries from every
+    character of a long run that has no '@' after it, which is quadratic.
+    """
+    find = text.find
+    pos = 0
+    while True:
+        at = find("@", pos)
+        if at < 0:
+            return
+        m = _EMAIL_DOMAIN_RE.match(text, at + 1)
+        if m is not None:
+            head = text[pos:at]
+            start = at - (len(head) - len(head.rstrip(_EMAIL_LOCAL_CHARS)))
+            if start < at:
+                yield text[start:m.end()]
+                pos = m.end()
+                continue
+        # Neither part can reach across an '@'
+        pos = at + 1
+
+
+def _attributes(tag: str) -> Dict[str, str]:
+    """Quoted attributes of a tag by lowercased name; a repeated name keeps its first value."""
+    attrs = {}
+    for name, double_quoted, single_quoted in _ATTR_RE.findall(tag):
+        attrs.setdefault(name.lower(), double_quoted or single_quoted)
+    return attrs
+
+
+def _elements(text: str, open_tag: str, close_tag: str, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yields (attrs_start, tag_end, close_start) for each ``<tag ...>inner</tag>``
+    in text[start:end], the same spans as the lazy ``<tag(.*?)>(.*?)</tag>``.
+    A forward scan with str.find: unclosed tags cost one pass instead of the
+    regex's backtracking through every later '>'.
+    """
+    if end is None:
+        end = len(text)
+    find = text.find
+    while True:
+        i = find(open_tag, start, end)
+        if i < 0:
+            return
+        gt = find(">", i + len(open_tag), end)
+        if gt < 0:
+            return
+        close = find(close_tag, gt + 1, end)
+        if close < 0:
+            # No close after this tag means none after any later one either
+            return
+        yield i + len(open_tag), gt, close
+        start = close + len(close_tag)
+
+
+def _strip_tags(text: str) -> str:
+    """Removes single-line ``<...>`` runs, like ``re.sub(r'<.*?>', '', text)``."""
+    if "<" not in text:
+        return text
+    parts = []
+    find = text.find
+    pos = keep = 0
+    gt = -1
+    while True:
+        lt = find("<", pos)
+        if lt < 0:
+            break
+        if gt < lt:
+            gt = find(">", lt + 1)
+            if gt < 0:
+                break
+        nl = find("\n", lt + 1, gt)
+        if nl >= 0:
+            # Every '<' before the newline shares this '>', so none can match
+            pos = nl + 1
+            continue
+        parts.append(text[keep:lt])
+        pos = keep = gt + 1
+    parts.append(text[keep:])
+    return "".join(parts)
+
 
 class Magnet:
+    __slots__ = ("content",)
+
     def __init__(self, content: str):
         self.content = content
 
     def emails(self) -> List[str]:
-        """Extracts all email addresses from the content."""
-        # Basic email regex
-        return list(set(re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', self.content)))
+        """Extracts all email addresses from the content, in first-seen order."""
+        return list(self.iter_emails())
+
+    def iter_emails(self) -> Iterator[str]:
+        """Yields each distinct email address as it is found, like emails()."""
+        seen = set()
+        for email in _iter_emails(self.content):
+            if email not in seen:
+                seen.add(email)
+                yield email
 
     def links(self) -> List[str]:
-        """Extracts all href links."""
-        return list(set(re.findall(r'href=["\'](.*?)["\']', self.content)))
+        """Extracts all href links, in first-seen order."""
+        return list(dict.fromkeys(_HREF_RE.findall(self.content)))
 
     def json_ld(self) -> List[Dict[str, Any]]:
         """Extracts JSON-LD scripts."""
         results = []
-        matches = re.findall(r'<script type="application/ld\+json">(.*?)</script>', self.content, re.DOTALL)
-        for m in matches:
+        # One block at a time: only the block being parsed is held as a copy
+        for jm in _JSONLD_RE.finditer(self.content):
+            m = jm.group(1)
+            if orjson is not None:
+                try:
+                    results.append(orjson.loads(m))
+                    continue
+                except orjson.JSONDecodeError:
+                    # Let the stdlib decide: it also takes NaN and big ints
+                    pass
             try:
                 results.append(json.loads(m))
             except json.JSONDecodeError:
@@ -43,38 +177,30 @@ class Magnet:
         
         # 1. JWT Tokens (Simple heuristic)
         # Search everywhere, including inside strings in scripts
-        data["jwts"] = list(set(re.findall(r'ey[a-zA-Z0-9_-]{10,}\.ey[a-zA-Z0-9_-]{10,}\.[a-zA-Z0-9_-]{10,}', self.content)))
+        data["jwts"] = list(set(_JWT_RE.findall(self.content)))
         
         # 2. API Keys (Common formats)
-        patterns = [
-            r'(?:key|api|token|secret|auth|cid|sid)["\']?\s*[:=]\s*["\']([a-zA-Z0-9\-_]{20,})["\']', # Generic in JSON/Key-Value
-            r'AIza[0-9A-Za-z\\-_]{35}', # Google API Key
-            r'(?:["\'])(AIza[0-9A-Za-z\\-_]{35})(?:["\'])', # Google Key in quotes
-        ]
-        for p in patterns:
-            matches = re.findall(p, self.content)
-            for m in matches:
-                # findall with groups returns the group, without groups returns the match
-                data["api_keys"].append(m if isinstance(m, str) else m[0])
-        data["api_keys"] = list(set(data["api_keys"]))
+        api_keys = set()
+        for p in _API_KEY_RES:
+            # findall yields the key group for the generic pattern, the whole match otherwise
+            api_keys.update(p.findall(self.content))
+        data["api_keys"] = list(api_keys)
         
         # 3. Hidden Inputs
         # <input type="hidden" name="..." value="...">
-        hidden_matches = re.finditer(r'<input[^>]*type=["\']hidden["\'][^>]*>', self.content, re.IGNORECASE)
+        hidden_matches = _HIDDEN_INPUT_RE.finditer(self.content)
         for hm in hidden_matches:
-            tag = hm.group(0)
-            name_m = re.search(r'name=["\'](.*?)["\']', tag, re.IGNORECASE)
-            val_m = re.search(r'value=["\'](.*?)["\']', tag, re.IGNORECASE)
-            if name_m:
-                 data["hidden_inputs"].append({name_m.group(1): val_m.group(1) if val_m else ""})
+            attrs = _attributes(hm.group(0))
+            if "name" in attrs:
+                 data["hidden_inputs"].append({attrs["name"]: attrs.get("value", "")})
                  
         # 4. Config objects in scripts (var config = { ... })
-        configs = re.findall(r'(?:var|const|let)\s+(?:\w+Config|config|appData|initialState)\s*=\s*({.*?});', self.content, re.DOTALL)
+        configs = _CONFIG_RE.findall(self.content)
         for c in configs:
             # Try to sanitize and parse
             try:
                 # This is risky and might fail if not pure JSON, but worth a shot for deep extraction
-                cleaned = re.sub(r'//.*?\n', '', c) # simple comment strip
+                cleaned = _JS_COMMENT_RE.sub('', c) # simple comment strip
                 # In real world we might use a JS parser, here we just keep the string if parse fails
                 data["found_js_configs"].append(cleaned.strip())
             except Exception:
@@ -87,65 +213,88 @@ class Magnet:
         Extracts HTML tables as nested lists.
         Very basic regex/logic, non-robust compared to creating a DOM tree.
         """
+        return list(self.iter_tables())
+
+    def iter_tables(self) -> Iterator[List[List[str]]]:
+        """
+        Yields tables one at a time, in the same shape as tables().
+        Lets callers stop early without parsing the rest of the page.
+        """
         # Note: Parsing tables with regex is famously bad. 
         # But per user request "not use any other lib", we do our best simple extraction.
-        tables = []
-        table_matches = re.findall(r'<table.*?>(.*?)</table>', self.content, re.DOTALL)
-        for t_html in table_matches:
+        content = self.content
+        rfind = content.rfind
+        for _, t_open, t_close in _elements(content, "<table", "</table>"):
             rows = []
-            tr_matches = re.findall(r'<tr.*?>(.*?)</tr>', t_html, re.DOTALL)
-            for tr in tr_matches:
+            for _, tr_open, tr_close in _elements(content, "<tr", "</tr>", t_open + 1, t_close):
                 cols = []
-                # grab td or th
-                td_matches = re.findall(r'<(?:td|th).*?>(.*?)</(?:td|th)>', tr, re.DOTALL)
-                for td in td_matches:
-                    # Clean tags inside
-                    text = re.sub(r'<.*?>', '', td).strip()
-                    cols.append(text)
+                # Scan only up to the row's last closing cell tag: no cell can
+                # match past it, and the regex would retry there from every '<td'
+                last_close = max(rfind("</td>", tr_open, tr_close), rfind("</th>", tr_open, tr_close))
+                if last_close >= 0:
+                    # grab td or th
+                    for td in _TD_RE.findall(content, tr_open + 1, last_close + 5):
+                        # Clean tags inside
+                        cols.append(_strip_tags(td).strip())
                 if cols:
                     rows.append(cols)
             if rows:
-                tables.append(rows)
-        return tables
+                yield rows
 
     def get_forms(self) -> List[Dict[str, Any]]:
         """
         Extracts forms and their inputs.
         Returns list of dicts: {'action': '...', 'method': '...', 'inputs': {'name': 'value', ...}}
         """
-        forms = []
+        return list(self.iter_forms())
+
+    def iter_forms(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields forms one at a time, in the same shape as get_forms().
+        Lets callers stop early without parsing the rest of the page.
+        """
+        content = self.content
+        if _FORM_TAG_RE.search(content) is None:
+            return
+        # Tags are matched case-insensitively on a lowered copy; the values
+        # come from the original text
+        lowered = content.lower() if content.isascii() else content.translate(_ASCII_LOWER)
+        find = lowered.find
         # Find forms
-        form_matches = re.finditer(r'<form(.*?)>(.*?)</form>', self.content, re.DOTALL | re.IGNORECASE)
-        for fm in form_matches:
-            attrs_str = fm.group(1)
-            inner_html = fm.group(2)
+        for f_attrs, f_open, f_close in _elements(lowered, "<form", "</form>"):
+            attrs = _attributes(content[f_attrs:f_open])
             
             # Extract action and method
-            action_m = re.search(r'action=["\'](.*?)["\']', attrs_str, re.IGNORECASE)
-            method_m = re.search(r'method=["\'](.*?)["\']', attrs_str, re.IGNORECASE)
-            
             form_data = {
-                "action": action_m.group(1) if action_m else None,
-                "method": method_m.group(1) if method_m else "GET",
+                "action": attrs.get("action"),
+                "method": attrs.get("method", "GET"),
                 "inputs": {}
             }
             
             # Extract inputs
             # <input name="foo" value="bar">
-            input_matches = re.finditer(r'<input(.*?)>', inner_html, re.IGNORECASE)
-            for im in input_matches:
-                i_attrs = im.group(1)
-                name_m = re.search(r'name=["\'](.*?)["\']', i_attrs, re.IGNORECASE)
-                val_m = re.search(r'value=["\'](.*?)["\']', i_attrs, re.IGNORECASE)
+            pos = f_open + 1
+            while True:
+                i = find("<input", pos, f_close)
+                if i < 0:
+                    break
+                i += len("<input")
+                gt = find(">", i, f_close)
+                if gt < 0:
+                    break
+                # An input tag ends on the line it starts on
+                nl = find("\n", i, gt)
+                if nl >= 0:
+                    pos = nl + 1
+                    continue
+                i_attrs = _attributes(content[i:gt])
+                pos = gt + 1
                 
-                if name_m:
-                    name = name_m.group(1)
-                    val = val_m.group(1) if val_m else ""
-                    form_data["inputs"][name] = val
+                if "name" in i_attrs:
+                    form_data["inputs"][i_attrs["name"]] = i_attrs.get("value", "")
                     
-            forms.append(form_data)
-        
-        return forms
+            yield form_data
+
     def ask(self, prompt: str, provider: str = "gemini", api_key: Optional[str] = None, model: Optional[str] = None) -> str:
         """
         Uses an AI provider to extract data or answer a question about the page content.
@@ -38,6 +38,9 @@ PROFILES = {
 
 DEFAULT_PROFILE = "chrome_120"
 
+# Legacy and gallery names together, sorted once for list_profiles()
+_ALL_NAMES = tuple(sorted(set(PROFILES) | set(FINGERPRINT_GALLERY)))
+
 
 # =============================================================================
 # UNIFIED API - Works with both legacy and new profiles
@@ -94,8 +97,7 @@ def list_profiles(browser: Optional[str] = None, os_name: Optional[str] = None)
     Returns:
         List of profile names
     """
-    all_names = list(PROFILES.keys()) + list(FINGERPRINT_GALLERY.keys())
-    unique_names = sorted(set(all_names))
+    unique_names = _ALL_NAMES
     
     if browser:
         browser = browser.lower()
@@ -105,7 +107,7 @@ def list_profiles(browser: Optional[str] = None, os_name: Optional[str] = None)
         os_name = os_name.lower()
         unique_names = [n for n in unique_names if os_name in n]
     
-    return unique_names
+    return list(unique_names)
 
 
 # =============================================================================
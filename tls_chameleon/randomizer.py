@@ -16,10 +16,100 @@ Variations include:
 """
 
 import random
-import copy
 import re
 from typing import Dict, Any, Optional, List, Tuple
 
+from .fingerprint_gallery import _copy_profile, _perturb_order
+
+# Chrome version: Chrome/120.0.6099.130
+_CHROME_UA_RE = re.compile(r'Chrome/(\d+)\.(\d+)\.(\d+)\.(\d+)')
+# Firefox version: Firefox/120.0
+_FIREFOX_UA_RE = re.compile(r'Firefox/(\d+)\.(\d+)')
+
+# Choices for the get_random_* helpers (repeats weight an entry)
+_COMMON_RESOLUTIONS = (
+    (1920, 1080),  # Full HD - most common
+    (1920, 1080),  # Weight it higher
+    (1920, 1080),
+    (2560, 1440),  # 2K
+    (1366, 768),   # HD laptop
+    (1536, 864),   # HD+
+    (1440, 900),   # WXGA+
+    (1680, 1050),  # WSXGA+
+    (2560, 1600),  # WQXGA
+    (3840, 2160),  # 4K
+    (1280, 720),   # HD
+    (1600, 900),   # HD+
+)
+
+_COMMON_TIMEZONES = (
+    ("America/New_York", -300),
+    ("America/Chicago", -360),
+    ("America/Los_Angeles", -480),
+    ("Europe/London", 0),
+    ("Europe/Paris", 60),
+    ("Europe/Berlin", 60),
+    ("Asia/Tokyo", 540),
+    ("Asia/Shanghai", 480),
+    ("Australia/Sydney", 660),
+    ("America/Sao_Paulo", -180),
+)
+
+_COMMON_LANGUAGES = (
+    "en-US,en;q=0.9",
+    "en-GB,en;q=0.9",
+    "en-US,en;q=0.9,es;q=0.8",
+    "en-US,en;q=0.9,fr;q=0.8",
+    "de-DE,de;q=0.9,en;q=0.8",
+    "fr-FR,fr;q=0.9,en;q=0.8",
+    "es-ES,es;q=0.9,en;q=0.8",
+    "ja-JP,ja;q=0.9,en;q=0.8",
+    "zh-CN,zh;q=0.9,en;q=0.8",
+    "pt-BR,pt;q=0.9,en;q=0.8",
+)
+
+
+def _bump_chrome_version(match: "re.Match", rng: random.Random) -> str:
+    major = match.group(1)
+    minor = match.group(2)
+    build = int(match.group(3))
+    patch = int(match.group(4))
+    
+    # Vary build by -50 to +100
+    new_build = max(0, build + rng.randint(-50, 100))
+    # Vary patch by -20 to +50
+    new_patch = max(0, patch + rng.randint(-20, 50))
+    
+    return f"Chrome/{major}.{minor}.{new_build}.{new_patch}"
+
+
+def _bump_firefox_version(match: "re.Match", rng: random.Random) -> str:
+    major = match.group(1)
+    minor = int(match.group(2))
+    # Only vary minor occasionally
+    if rng.random() < 0.3:
+        minor = max(0, minor + rng.randint(0, 1))
+    return f"Firefox/{major}.{minor}"
+
+
+def _parse_ua_versions(ua: str) -> Tuple[List["re.Match"], List[int], List[str]]:
+    """
+    Split a User-Agent around its Chrome/Firefox version tokens.
+    
+    Returns the matches (every Chrome one, then every Firefox one: the order
+    their versions are randomized in), their indices sorted by position, and
+    the literal text around them.
+    """
+    matches = list(_CHROME_UA_RE.finditer(ua)) + list(_FIREFOX_UA_RE.finditer(ua))
+    order = sorted(range(len(matches)), key=lambda i: matches[i].start())
+    literals = []
+    pos = 0
+    for i in order:
+        literals.append(ua[pos:matches[i].start()])
+        pos = matches[i].end()
+    literals.append(ua[pos:])
+    return matches, order, literals
+
 
 class FingerprintRandomizer:
     """
@@ -29,6 +119,8 @@ class FingerprintRandomizer:
     the original browser would actually produce.
     """
     
+    __slots__ = ("base_profile", "randomization_config", "_rng", "_ua_parsed")
+    
     def __init__(self, profile: Dict[str, Any]):
         """
         Initialize the randomizer with a base profile.
@@ -38,6 +130,10 @@ class FingerprintRandomizer:
         """
         self.base_profile = profile
         self.randomization_config = profile.get("randomization", {})
+        self._rng = random.Random()  # Per-instance RNG for every variant draw
+        # (ua, _parse_ua_versions(ua)) for the last User-Agent randomized;
+        # every variant starts from the same one
+        self._ua_parsed: Optional[Tuple[str, Tuple[List["re.Match"], List[int], List[str]]]] = None
     
     def generate_variant(self) -> Dict[str, Any]:
         """
@@ -46,25 +142,50 @@ class FingerprintRandomizer:
         Returns:
             A new profile dict with slight variations
         """
-        variant = copy.deepcopy(self.base_profile)
+        return self.generate_variants(1)[0]
+    
+    def generate_variants(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Generate several randomized variants of the base profile at once.
         
-        # Apply User-Agent variance
-        if self.randomization_config.get("ua_minor_variance", False):
-            variant["user_agent"] = self._randomize_user_agent(variant.get("user_agent", ""))
-            variant["sec_ch_ua"] = self._randomize_sec_ch_ua(variant.get("sec_ch_ua", ""))
+        The randomization config is resolved a single time and shared by
+        every variant, so this is cheaper than calling generate_variant()
+        in a loop.
         
-        # Apply TLS extension order variance
-        ext_variance = self.randomization_config.get("extension_variance", 0)
-        if ext_variance > 0 and "extensions" in variant:
-            variant["extensions"] = self._randomize_extensions(
-                variant["extensions"], ext_variance
-            )
+        Args:
+            n: Number of variants to generate
+            
+        Returns:
+            List of new profile dicts with slight variations
+        """
+        config = self.randomization_config
+        ua_variance = config.get("ua_minor_variance", False)
+        ext_variance = config.get("extension_variance", 0)
+        cipher_shuffle = config.get("cipher_shuffle", False)
+        base = self.base_profile
         
-        # Apply cipher order variance (if allowed by browser)
-        if self.randomization_config.get("cipher_shuffle", False) and "ciphers" in variant:
-            variant["ciphers"] = self._randomize_ciphers(variant["ciphers"])
+        variants = []
+        for _ in range(n):
+            variant = _copy_profile(base)
+            
+            # Apply User-Agent variance
+            if ua_variance:
+                variant["user_agent"] = self._randomize_user_agent(variant.get("user_agent", ""))
+                variant["sec_ch_ua"] = self._randomize_sec_ch_ua(variant.get("sec_ch_ua", ""))
+            
+            # Apply TLS extension order variance
+            if ext_variance > 0 and "extensions" in variant:
+                variant["extensions"] = self._randomize_extensions(
+                    variant["extensions"], ext_variance
+                )
+            
+            # Apply cipher order variance (if allowed by browser)
+            if cipher_shuffle and "ciphers" in variant:
+                variant["ciphers"] = self._randomize_ciphers(variant["ciphers"])
+            
+            variants.append(variant)
         
-        return variant
+        return variants
     
     def _randomize_user_agent(self, ua: str) -> str:
         """
@@ -75,42 +196,23 @@ class FingerprintRandomizer:
         if not ua:
             return ua
         
-        # Pattern for Chrome version: Chrome/120.0.6099.130
-        def bump_chrome_version(match):
-            major = match.group(1)
-            minor = match.group(2)
-            build = int(match.group(3))
-            patch = int(match.group(4))
-            
-            # Vary build by -50 to +100
-            new_build = max(0, build + random.randint(-50, 100))
-            # Vary patch by -20 to +50
-            new_patch = max(0, patch + random.randint(-20, 50))
-            
-            return f"Chrome/{major}.{minor}.{new_build}.{new_patch}"
-        
-        ua = re.sub(
-            r'Chrome/(\d+)\.(\d+)\.(\d+)\.(\d+)',
-            bump_chrome_version,
-            ua
-        )
-        
-        # Pattern for Firefox version: Firefox/120.0
-        def bump_firefox_version(match):
-            major = match.group(1)
-            minor = int(match.group(2))
-            # Only vary minor occasionally
-            if random.random() < 0.3:
-                minor = max(0, minor + random.randint(0, 1))
-            return f"Firefox/{major}.{minor}"
-        
-        ua = re.sub(
-            r'Firefox/(\d+)\.(\d+)',
-            bump_firefox_version,
-            ua
-        )
+        parsed = self._ua_parsed
+        if parsed is None or parsed[0] != ua:
+            parsed = self._ua_parsed = (ua, _parse_ua_versions(ua))
+        matches, order, literals = parsed[1]
+        if not matches:
+            return ua
         
-        return ua
+        rng = self._rng
+        bumped = [
+            _bump_chrome_version(m, rng) if m.re is _CHROME_UA_RE else _bump_firefox_version(m, rng)
+            for m in matches
+        ]
+        parts = [literals[0]]
+        for literal, i in zip(literals[1:], order):
+            parts.append(bumped[i])
+            parts.append(literal)
+        return "".join(parts)
     
     def _randomize_sec_ch_ua(self, sec_ch_ua: str) -> str:
         """
@@ -132,15 +234,7 @@ class FingerprintRandomizer:
         if not extensions or variance <= 0:
             return extensions
         
-        exts = list(extensions)
-        
-        # Perform swap operations
-        swaps = min(variance, len(exts) - 1)
-        for _ in range(swaps):
-            i = random.randint(0, len(exts) - 2)
-            exts[i], exts[i + 1] = exts[i + 1], exts[i]
-        
-        return exts
+        return _perturb_order(extensions, variance, self._rng)
     
     def _randomize_ciphers(self, ciphers: List[str]) -> List[str]:
         """
@@ -153,7 +247,7 @@ class FingerprintRandomizer:
         
         # Create a shuffled copy
         shuffled = list(ciphers)
-        random.shuffle(shuffled)
+        self._rng.shuffle(shuffled)
         return shuffled
     
     @staticmethod
@@ -164,21 +258,7 @@ class FingerprintRandomizer:
         Returns:
             Tuple of (width, height)
         """
-        common_resolutions = [
-            (1920, 1080),  # Full HD - most common
-            (1920, 1080),  # Weight it higher
-            (1920, 1080),
-            (2560, 1440),  # 2K
-            (1366, 768),   # HD laptop
-            (1536, 864),   # HD+
-            (1440, 900),   # WXGA+
-            (1680, 1050),  # WSXGA+
-            (2560, 1600),  # WQXGA
-            (3840, 2160),  # 4K
-            (1280, 720),   # HD
-            (1600, 900),   # HD+
-        ]
-        return random.choice(common_resolutions)
+        return random.choice(_COMMON_RESOLUTIONS)
     
     @staticmethod
     def get_random_timezone() -> Tuple[str, int]:
@@ -188,19 +268,7 @@ class FingerprintRandomizer:
         Returns:
             Tuple of (timezone_name, offset_minutes)
         """
-        common_timezones = [
-            ("America/New_York", -300),
-            ("America/Chicago", -360),
-            ("America/Los_Angeles", -480),
-            ("Europe/London", 0),
-            ("Europe/Paris", 60),
-            ("Europe/Berlin", 60),
-            ("Asia/Tokyo", 540),
-            ("Asia/Shanghai", 480),
-            ("Australia/Sydney", 660),
-            ("America/Sao_Paulo", -180),
-        ]
-        return random.choice(common_timezones)
+        return random.choice(_COMMON_TIMEZONES)
     
     @staticmethod
     def get_random_language_preference() -> str:
@@ -210,19 +278,7 @@ class FingerprintRandomizer:
         Returns:
             Accept-Language header value
         """
-        common_languages = [
-            "en-US,en;q=0.9",
-            "en-GB,en;q=0.9",
-            "en-US,en;q=0.9,es;q=0.8",
-            "en-US,en;q=0.9,fr;q=0.8",
-            "de-DE,de;q=0.9,en;q=0.8",
-            "fr-FR,fr;q=0.9,en;q=0.8",
-            "es-ES,es;q=0.9,en;q=0.8",
-            "ja-JP,ja;q=0.9,en;q=0.8",
-            "zh-CN,zh;q=0.9,en;q=0.8",
-            "pt-BR,pt;q=0.9,en;q=0.8",
-        ]
-        return random.choice(common_languages)
+        return random.choice(_COMMON_LANGUAGES)
 
 
 def create_variant_profile(profile_name: str, randomize: bool = True) -> Dict[str, Any]:
@@ -247,7 +303,7 @@ def create_variant_profile(profile_name: str, randomize: bool = True) -> Dict[st
         randomizer = FingerprintRandomizer(profile)
         return randomizer.generate_variant()
     
-    return copy.deepcopy(profile)
+    return _copy_profile(profile)
 
 
 def batch_generate_variants(
@@ -267,8 +323,11 @@ def batch_generate_variants(
     Returns:
         List of variant profile dicts
     """
-    variants = []
-    for _ in range(count):
-        variant = create_variant_profile(profile_name, randomize=True)
-        variants.append(variant)
-    return variants
+    from .fingerprint_gallery import FINGERPRINT_GALLERY, get_profile
+    
+    profile = get_profile(profile_name)
+    if not profile:
+        # Fall back to chrome_120_win11
+        profile = FINGERPRINT_GALLERY.get("chrome_120_win11", {})
+    
+    return FingerprintRandomizer(profile).generate_variants(count)